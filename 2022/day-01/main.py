@@ -0,0 +1,142 @@
+import heapq
+
+from aoc import loader
+
+NEWLINE = ord('\n')
+# Other whitespace a line may carry (CRLF endings, stray spaces), ignored as str.strip() would
+BLANKS = [ord(c) for c in '\r \t']
+# 10**n for every digit place an int64 can hold
+POWERS_OF_TEN = [10 ** n for n in range(19)]
+# Inventories at least this big are summed with NumPy; below it, importing NumPy costs more than it saves
+VECTORIZE_BYTES = 1 << 20
+
+
+@loader.takes_bytes
+def parse(data):
+    # Nothing to build up front: the parts stream over the (memory-mapped) inventory
+    return loader.as_buffer(data)
+
+
+def inventory_lines(data):
+    """Yield each line of an in-memory or memory-mapped inventory as bytes, one at a time."""
+    for start, end in loader.line_spans(data):
+        yield bytes(data[start:end])
+
+
+def top_calories(lines, k=3):
+    """
+    Return (sum, elf number) for the k elves carrying the most calories, largest first.
+
+    Reads the lines (bytes or str, e.g. straight from a file opened in binary mode) in one pass,
+    keeping only the running total of the current elf and a min-heap of the best k so far, so
+    memory stays O(k) however large the inventory is. Every blank line starts a new elf;
+    elves are numbered from 1.
+    """
+    top = []
+    elf, total = 1, 0
+    for line in lines:
+        line = line.strip()
+        if line:
+            total += int(line)
+            continue
+        # A blank line ends the current elf
+        if len(top) < k:
+            heapq.heappush(top, (total, elf))
+        else:
+            heapq.heappushpop(top, (total, elf))
+        elf, total = elf + 1, 0
+
+    # The last elf is not followed by a blank line
+    if len(top) < k:
+        heapq.heappush(top, (total, elf))
+    else:
+        heapq.heappushpop(top, (total, elf))
+    return sorted(top, reverse=True)
+
+
+def top_calories_vectorized(data, k=3):
+    """
+    The same result as top_calories for a whole in-memory or memory-mapped inventory, computed
+    with NumPy in a fixed number of array passes and no per-line or per-elf Python objects.
+
+    The bytes are parsed into one int64 value per line (0 for blank lines) plus a mask of the
+    blank lines that separate the elves; np.add.reduceat sums each elf's stretch of lines and
+    np.argpartition picks the top k. Carriage returns, spaces and tabs are dropped first; any other
+    byte that is not a digit or a newline raises ValueError. An inventory whose numbers are too
+    long for int64 sums to be exact is handed to top_calories instead.
+    """
+    import numpy as np
+
+    buffer = np.frombuffer(loader.as_buffer(data), dtype=np.uint8)
+    buffer = buffer[~np.isin(buffer, BLANKS)]
+    if not np.all((buffer == NEWLINE) | ((buffer >= ord('0')) & (buffer <= ord('9')))):
+        raise ValueError("an inventory holds only numbers, one per line, and blank lines")
+    if len(buffer) == 0:
+        return [(0, 1)][:k]
+    if buffer[-1] != NEWLINE:
+        buffer = np.append(buffer, np.uint8(NEWLINE))
+
+    # Every line ends at a newline; a line's value is the sum of digit * 10**(places to its end)
+    is_newline = buffer == NEWLINE
+    line_ends = np.flatnonzero(is_newline)
+    line_lengths = np.diff(line_ends, prepend=-1) - 1
+    # Every sum is below (number of lines) * 10**(longest line), so below that bound int64 is exact
+    if len(line_ends) * 10 ** int(line_lengths.max()) > np.iinfo(np.int64).max:
+        return top_calories(inventory_lines(loader.as_buffer(data)), k)
+    digit_positions = np.flatnonzero(~is_newline)
+    line_of_digit = np.cumsum(is_newline)[digit_positions]
+    places = line_ends[line_of_digit] - digit_positions - 1
+    digits = (buffer[digit_positions] - ord('0')).astype(np.int64) * np.array(POWERS_OF_TEN, dtype=np.int64)[places]
+
+    is_blank = line_lengths == 0
+    values = np.zeros(len(line_ends), dtype=np.int64)
+    first_digits = np.cumsum(line_lengths) - line_lengths
+    values[~is_blank] = np.add.reduceat(digits, first_digits[~is_blank]) if len(digits) else 0
+
+    # Each elf's lines run from one blank line (or the start) to the next; blank lines add 0
+    elf_starts = np.concatenate(([0], np.flatnonzero(is_blank)))
+    sums = np.add.reduceat(values, elf_starts)
+
+    k = min(k, len(sums))
+    if k <= 0:
+        return []
+    # The k-th largest sum; everything above it is in, and of the elves on it, the later ones
+    # are, as with top_calories' heap of (sum, elf)
+    threshold = sums[np.argpartition(sums, len(sums) - k)[len(sums) - k]]
+    above = np.flatnonzero(sums > threshold)
+    tied = np.flatnonzero(sums == threshold)[len(above) - k:]
+    return sorted(((int(sums[i]), int(i) + 1) for i in np.concatenate((above, tied))), reverse=True)
+
+
+def top_elves(data, k):
+    """Pick the streaming or the vectorized top-k for an inventory held in memory or mapped."""
+    if len(data) >= VECTORIZE_BYTES:
+        return top_calories_vectorized(data, k)
+    return top_calories(inventory_lines(data), k)
+
+
+def part1(data):
+    sum_value, index = top_elves(data, 1)[0]
+    return sum_value
+
+
+def part2(data):
+    # Get the top 3 elves and calculate the total of their sums
+    top_3 = top_elves(data, 3)
+    return sum(sum_value for sum_value, index in top_3)
+
+
+def main():
+    # Stream the local input file line by line; it is never held in memory as a whole
+    with open('input', 'rb') as f:
+        top_3 = top_calories(f, 3)
+
+    for sum_value, index in top_3:
+        print(f"elf {index} is carrying {sum_value} calories")
+
+    print(f"The most calories carried by one elf are {top_3[0][0]} calories.")
+    print(f"The total calories carried by the top 3 elves are {sum(sum_value for sum_value, index in top_3)} calories.")
+
+
+if __name__ == "__main__":
+    main()
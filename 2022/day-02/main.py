@@ -0,0 +1,125 @@
+
+"""
+Opponent:
+
+A=rock
+B=paper
+C=scissors
+
+So break input into blocks of three rows and
+for each block calculate each row according to
+
+Part 1, you:
+
+X=rock, 1
+Y=paper, 2
+Z=scissors, 3
+
+plus
+
+Win = 6
+Draw = 3
+Lose = 0
+
+so
+
+A X = Draw, 3+1=4
+A Y = Win, 6+2=8
+A Z = Lose, 0+3=3
+B X = Lose, 0+1=1
+B Y = Draw, 3+2=5
+B Z = Win, 6+3=9
+C X = Win, 6+1=
+C Y = Lose, 0+2=2
+C Z = Draw, 3+3=6
+
+Part 2, you:
+
+rock, 1
+paper, 2
+scissors, 3
+
+plus
+
+X=lose, 0
+Y=draw, 3
+Z=win, 6
+
+ """
+
+from aoc import loader
+
+# Every possible round as it appears in the guide, in table order: b"A X", b"A Y", ... b"C Z"
+ROUNDS = [bytes([opponent, ord(' '), response]) for opponent in b"ABC" for response in b"XYZ"]
+# Guides are scored this many bytes at a time, so memory stays flat for any size of guide
+CHUNK_BYTES = 1 << 20
+
+
+def score_table(part):
+    """
+    The score of each of the nine rounds, in ROUNDS order, derived from the rules above rather
+    than written out. Shapes and outcomes count from 0: rock, paper, scissors and lose, draw, win.
+    """
+    table = []
+    for opponent in range(3):
+        for response in range(3):
+            if part == 1:
+                # XYZ is your shape, and a shape beats the one before it
+                shape, outcome = response, (response - opponent + 1) % 3
+            else:
+                # XYZ is the outcome, so play the shape that many steps round from the opponent's
+                shape, outcome = (opponent + response - 1) % 3, response
+            table.append(shape + 1 + 3 * outcome)
+    return table
+
+
+SCORES_PART1 = score_table(1)
+SCORES_PART2 = score_table(2)
+
+
+def round_counts(data, chunk_bytes=CHUNK_BYTES):
+    """
+    How many times each of the nine rounds appears in the guide, in ROUNDS order.
+
+    The guide is read in chunks that end on a line break and each chunk is tallied with
+    bytes.count, so there is no per-line Python work at all.
+    """
+    view = memoryview(loader.as_buffer(data))
+    counts = [0] * len(ROUNDS)
+    start = 0
+    while start < len(view):
+        end = min(start + chunk_bytes, len(view))
+        # Extend the chunk to the end of its last line so no round is split in two
+        while end < len(view) and view[end - 1] != ord('\n'):
+            end += 1
+        chunk = bytes(view[start:end])
+        for i, guide_round in enumerate(ROUNDS):
+            counts[i] += chunk.count(guide_round)
+        start = end
+    return counts
+
+
+@loader.takes_bytes
+def parse(data):
+    # One pass over the guide feeds both parts
+    return round_counts(data)
+
+
+def part1(counts):
+    return sum(count * score for count, score in zip(counts, SCORES_PART1))
+
+
+def part2(counts):
+    return sum(count * score for count, score in zip(counts, SCORES_PART2))
+
+
+def main():
+    guide = loader.load('input')
+    counts = parse(guide)
+
+    print("part 1 solution:", part1(counts))
+    print("part 2 solution:", part2(counts))
+
+
+if __name__ == "__main__":
+    main()
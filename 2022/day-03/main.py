@@ -0,0 +1,69 @@
+import string
+from collections import namedtuple
+
+from aoc import loader
+
+# Each item type is one bit of a 52-bit mask: a-z are bits 0-25 and A-Z bits 26-51, so an item's
+# priority is its bit position plus one, i.e. the bit_length() of a mask holding only that item
+ITEM_BITS = [0] * 256
+for position, letter in enumerate(string.ascii_letters):
+    ITEM_BITS[ord(letter)] = 1 << position
+
+# The answers to both parts, gathered in the same pass over the rucksacks
+Priorities = namedtuple('Priorities', ['misplaced', 'badges'])
+
+
+def item_mask(items):
+    """The set of item types in a run of bytes, as a bitmask."""
+    mask = 0
+    for item in items:
+        mask |= ITEM_BITS[item]
+    return mask
+
+
+def get_priority(mask):
+    # A mask holding a single item type; 0 (no common item) scores nothing
+    return mask.bit_length()
+
+
+@loader.takes_bytes
+def parse(data):
+    """
+    Streams over the rucksacks once, intersecting compartments and groups of three with bitwise
+    ANDs, and returns the sum of priorities for both parts.
+    """
+    view = memoryview(loader.as_buffer(data))
+    misplaced = badges = 0
+    group = 0
+    rucksacks = (span for span in loader.line_spans(view) if span[1] > span[0])
+    for i, (start, end) in enumerate(rucksacks):
+        half = start + (end - start) // 2
+        first_half = item_mask(view[start:half])
+        second_half = item_mask(view[half:end])
+        # Part 1: the one item in both compartments
+        misplaced += get_priority(first_half & second_half)
+
+        # Part 2: the one item in all three rucksacks of a group
+        items = first_half | second_half
+        group = items if i % 3 == 0 else group & items
+        if i % 3 == 2:
+            badges += get_priority(group)
+    return Priorities(misplaced, badges)
+
+
+def part1(priorities):
+    return priorities.misplaced
+
+
+def part2(priorities):
+    return priorities.badges
+
+
+def main():
+    priorities = parse(loader.load('input'))
+    print("part 1 solution:", part1(priorities))
+    print("part 2 solution:", part2(priorities))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+""" Initial planning:
+chunk list by single row
+split chunk on comma
+for each split convert notation to range
+part 1: return count of instances where one range is a subset of the other
+part 2: return count of instances where the ranges overlap at all
+
+All pairs are loaded into NumPy columns and each part is one vectorised predicate; sorted-endpoint
+indexes answer further range queries (e.g. `assignments.shared.count_overlapping(10, 20)`, the
+pairs doing duplicate work somewhere in sections 10-20) without rescanning the input.
+"""
+from functools import cached_property
+
+import numpy as np
+
+from aoc import loader
+
+
+class SectionIndex:
+    """
+    Sorted start and end sections of a set of ranges, answering "how many ranges touch these
+    sections" with two binary searches instead of a scan.
+    """
+
+    def __init__(self, starts, ends):
+        self.starts = np.sort(starts)
+        self.ends = np.sort(ends)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def count_overlapping(self, first, last):
+        """How many ranges share at least one section with first-last (inclusive)."""
+        # Everything except the ranges that end before `first` or start after `last`
+        ends_before = np.searchsorted(self.ends, first, side='left')
+        starts_after = len(self.starts) - np.searchsorted(self.starts, last, side='right')
+        return int(len(self.starts) - ends_before - starts_after)
+
+    def count_containing(self, section):
+        """How many ranges include the given section."""
+        return self.count_overlapping(section, section)
+
+
+class Assignments:
+    """
+    Every pair's section ranges as NumPy int64 columns: ``x`` is the first elf's (start, end)
+    and ``y`` the second's. The part predicates run over all pairs at once.
+    """
+
+    def __init__(self, sections):
+        # One row of four numbers per pair: x start, x end, y start, y end
+        self.sections = np.asarray(sections, dtype=np.int64).reshape(-1, 4)
+        self.x = self.sections[:, 0], self.sections[:, 1]
+        self.y = self.sections[:, 2], self.sections[:, 3]
+
+    def __len__(self):
+        return len(self.sections)
+
+    @cached_property
+    def elves(self):
+        """Index over every elf's range, both elves of every pair."""
+        return SectionIndex(self.sections[:, 0::2].ravel(), self.sections[:, 1::2].ravel())
+
+    @cached_property
+    def shared(self):
+        """Index over the sections each overlapping pair has in common, one range per such pair."""
+        mask = overlaps(self.x, self.y)
+        starts = np.maximum(self.x[0], self.y[0])[mask]
+        ends = np.minimum(self.x[1], self.y[1])[mask]
+        return SectionIndex(starts, ends)
+
+
+def fully_contains(x, y):
+    # checks if range x is a subset of range y, and (y[0] >= x[0] and y[1] <= x[1]) checks if range y is a subset of range x.
+    # Works element-wise on arrays of starts and ends, returning a boolean array.
+    return ((x[0] >= y[0]) & (x[1] <= y[1])) | ((y[0] >= x[0]) & (y[1] <= x[1]))
+
+
+def overlaps(x, y):
+    # checks whether the start of the intersection range (the maximum of the two starts) is less than or equal to the end of the intersection range (the minimum of the two ends).
+    return np.maximum(x[0], y[0]) <= np.minimum(x[1], y[1])
+
+
+@loader.takes_bytes
+def parse(data):
+    # The `-` in `2-4` separates a range, it is not a minus sign
+    return Assignments(loader.ints(data, signed=False))
+
+
+def part1(assignments):
+    return int(np.count_nonzero(fully_contains(assignments.x, assignments.y)))
+
+
+def part2(assignments):
+    return int(np.count_nonzero(overlaps(assignments.x, assignments.y)))
+
+
+def main():
+    assignments = parse(loader.load('input'))
+    print("part 1 solution:", part1(assignments))
+    print("part 2 solution:", part2(assignments))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# See https://github.com/GalaxyInfernoCodes/Advent_Of_Code_2022/blob/main/Day05_Python/AdventOfCode_Day05_Py.ipynb
+# and https://galaxyinferno.com/how-to-solve-advent-of-code-2022-day-5-with-python/
+
+
+class CrateStack:
+    """
+    A stack of crates, bottom first. Crates only ever leave from and arrive at the end of the
+    list, so a move costs O(crates moved) however tall the stack is.
+    """
+
+    def __init__(self) -> None:
+        self.content = []
+
+    def add_item_on_top(self, item):
+        self.content.append(item)
+
+    def take_x_crates(self, x, move_multiple):
+        if x == 0:
+            # content[-0:] would be the whole stack
+            return []
+        # Copy the top x crates and truncate the stack in place, rather than copying what stays
+        return_crates = self.content[-x:]
+        del self.content[-x:]
+        if move_multiple:
+            # The CrateMover 9001 moves them all at once, keeping their order
+            return return_crates
+        else:
+            # The 9000 moves one at a time, so they land in reverse
+            return_crates.reverse()
+            return return_crates
+
+    def add_crates(self, new_crates):
+        self.content.extend(new_crates)
+
+    def get_top_content(self):
+        return self.content[-1] if len(self.content) > 0 else ""
+
+
+class CargoBay:
+    def __init__(self, number_of_crates):
+        self.number_of_crates = number_of_crates
+        self.crates = [CrateStack() for _ in range(number_of_crates)]
+
+    def add_items_to_crates(self, items):
+        for crate, item in zip(self.crates, items):
+            if item != ' ':
+                crate.add_item_on_top(item)
+
+    def move_items(self, amount, source, target, move_multiple):
+        moving_crates = self.crates[source].take_x_crates(
+            amount, move_multiple)
+        self.crates[target].add_crates(moving_crates)
+
+    def get_top_stacks(self):
+        return_message = ""
+        for crate in self.crates:
+            return_message += crate.get_top_content()
+        return return_message
+
+    def print_crates(self):
+        for crate in self.crates:
+            print(crate.content)
+        print('-----')
+
+
+class LazyCargoBay:
+    """
+    The same interface as CargoBay, but moves are only recorded, never carried out.
+
+    Only the top crate of each stack is ever asked for, so get_top_stacks traces each of those
+    back through the moves in reverse to its place in the starting stacks. The cost is the
+    number of moves times the number of stacks, however many crates the moves shift.
+    """
+
+    def __init__(self, number_of_crates):
+        self.number_of_crates = number_of_crates
+        self.initial = [[] for _ in range(number_of_crates)]
+        self.heights = [0] * number_of_crates
+        self.moves = []
+
+    def add_items_to_crates(self, items):
+        for stack, item in enumerate(items):
+            if item != ' ':
+                self.initial[stack].append(item)
+                self.heights[stack] += 1
+
+    def move_items(self, amount, source, target, move_multiple):
+        self.moves.append((amount, source, target, move_multiple))
+        self.heights[source] -= amount
+        self.heights[target] += amount
+
+    def resolve(self, stack, depth):
+        """The crate ``depth`` places below the top of ``stack`` once every move has been made."""
+        for amount, source, target, move_multiple in reversed(self.moves):
+            if source == target:
+                # Crates lifted off a stack and put straight back: the 9000 reverses the top
+                # ``amount`` of them, the 9001 changes nothing, and nothing below them moves
+                if stack == source and depth < amount and not move_multiple:
+                    depth = amount - 1 - depth
+            elif stack == target:
+                if depth < amount:
+                    # The crate arrived with this move: before it, it was among the source's top crates,
+                    # in the same order for the CrateMover 9001 and reversed for the 9000
+                    stack = source
+                    if not move_multiple:
+                        depth = amount - 1 - depth
+                else:
+                    depth -= amount
+            elif stack == source:
+                # The moved crates sat on top of this one before the move
+                depth += amount
+        crates = self.initial[stack]
+        return crates[len(crates) - 1 - depth]
+
+    def get_top_stacks(self):
+        return_message = ""
+        for stack in range(self.number_of_crates):
+            if self.heights[stack] > 0:
+                return_message += self.resolve(stack, 0)
+        return return_message
+
+
+# The cargo bays solve() can run the moves on
+ENGINES = {'eager': CargoBay, 'lazy': LazyCargoBay}
+
+
+def parse(text):
+    """Return the crate lines (bottom row first) and the moves as 0-based (amount, source, target)."""
+    lines = text.splitlines(keepends=True)
+
+    # everything before the empty line (minus the ' 1   2   3...' line are crate lines)
+    crate_lines = lines[:lines.index('\n')-1]
+    # iterate over the crates from the bottom to the top
+    crate_rows = [list(line)[1:-1:4] for line in reversed(crate_lines)]
+
+    # everything after the empty line are moving lines
+    moving_lines = lines[lines.index('\n')+1:]
+    moves = []
+    for line in moving_lines:
+        amount, source, target = [
+            int(entry) for entry in line.strip().split(' ') if entry.isdigit()]
+        moves.append((amount, source-1, target-1))
+
+    number_of_crates = len(lines[0])//4
+    return number_of_crates, crate_rows, moves
+
+
+def solve(parsed, part_2=False, print_crates=False, engine=None):
+    """
+    The top crates after every move. ``engine`` picks the cargo bay: 'eager' (CargoBay) moves the
+    crates, 'lazy' (LazyCargoBay) only records the moves and traces the tops back, which does not
+    depend on how many crates each move shifts. Lazy is the default; printing the stacks as they
+    go needs the crates physically moved, so ``print_crates`` defaults to eager.
+    """
+    if engine is None:
+        engine = 'eager' if print_crates else 'lazy'
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {', '.join(ENGINES)}, not {engine!r}")
+    if print_crates and engine != 'eager':
+        raise ValueError("print_crates needs the eager engine")
+    number_of_crates, crate_rows, moves = parsed
+    cargo_bay = ENGINES[engine](number_of_crates)
+    for items in crate_rows:
+        cargo_bay.add_items_to_crates(items)
+
+    for amount, source, target in moves:
+        if print_crates:
+            cargo_bay.print_crates()
+        cargo_bay.move_items(amount, source, target, part_2)
+
+    return cargo_bay.get_top_stacks()
+
+
+def part1(parsed):
+    return solve(parsed, part_2=False)
+
+
+def part2(parsed):
+    return solve(parsed, part_2=True)
+
+
+def main():
+    with open('input.txt', 'r') as f:
+        parsed = parse(f.read())
+    print("part 1 solution:", part1(parsed))
+    print("part 2 solution:", part2(parsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+""" find 4 characters that are all different
+
+identify the first position where the four most recently received characters were all different. Specifically, it needs to report the number of characters from the beginning of the buffer to the end of the first such four-character marker.
+
+1234567890
+mjqjpqmgbljsphdztnvjfqwrcgsmlb = 7
+
+bvwbjplbgvbhsrlpgdmjqwftvncz: character 5
+nppdvjthqldpwncqszvftbrmjlhg: character 6 - seems to be an error
+nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg: character 10
+zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw: character 11
+
+part 2 is the same with 14 distinct characters
+
+
+# read input and find first position of first character that isn a sequence of 4 unique characters
+
+# based on https://galaxyinferno.com/how-to-solve-advent-of-code-2022-day-6-with-python/
+
+ """
+
+from aoc import loader
+
+# Window sizes looked for in one pass: start-of-packet and start-of-message markers
+MARKER_SIZES = (4, 14)
+# Datastreams are scanned this many bytes at a time when read from a file
+CHUNK_BYTES = 1 << 20
+
+
+class MarkerScanner:
+    """
+    Finds the end of the first window of distinct bytes for each of several window sizes, in a
+    single pass over a datastream fed in chunks.
+
+    Keeps the index at which each byte value was last seen and where the current run of distinct
+    bytes starts: a byte seen inside the run moves its start past the earlier copy. That is O(1)
+    per byte for any window size, and nothing but the 256-entry table is kept between chunks.
+    The run grows by at most one byte per step, so the sizes are found smallest first and only
+    the smallest one still missing needs checking.
+    """
+
+    def __init__(self, sizes=MARKER_SIZES):
+        self.pending = sorted(set(sizes), reverse=True)  # Smallest last, to pop
+        self.markers = {}
+        self.last_seen = [-1] * 256
+        self.run_start = 0
+        self.offset = 0  # Stream position of the next chunk's first byte
+
+    @property
+    def done(self):
+        return not self.pending
+
+    def feed(self, chunk):
+        """Scan the next chunk of bytes; returns True once every marker has been found."""
+        if self.done:
+            return True
+        last_seen, run_start, pending = self.last_seen, self.run_start, self.pending
+        size = pending[-1]
+        for i, byte in enumerate(chunk, self.offset):
+            if last_seen[byte] >= run_start:
+                run_start = last_seen[byte] + 1
+            last_seen[byte] = i
+            if i - run_start + 1 >= size:
+                # Count characters from the start of the stream to the end of the marker
+                self.markers[pending.pop()] = i + 1
+                if not pending:
+                    break
+                size = pending[-1]
+        self.run_start = run_start
+        self.offset += len(chunk)
+        return self.done
+
+
+def find_markers(signal, sizes=MARKER_SIZES):
+    """The first marker position for each window size, or None for sizes never found."""
+    scanner = MarkerScanner(sizes)
+    scanner.feed(loader.as_buffer(signal))
+    return {size: scanner.markers.get(size) for size in sizes}
+
+
+def find_marker(signal, size):
+    return find_markers(signal, (size,))[size]
+
+
+def scan_file(path, sizes=MARKER_SIZES, chunk_bytes=CHUNK_BYTES):
+    """Find the markers in a datastream file of any size, reading it a chunk at a time."""
+    scanner = MarkerScanner(sizes)
+    with open(path, 'rb') as file:
+        while chunk := file.read(chunk_bytes):
+            # Only the first line is the datastream
+            chunk, newline, _ = chunk.partition(b'\n')
+            if scanner.feed(chunk) or newline:
+                break
+    return {size: scanner.markers.get(size) for size in sizes}
+
+
+def all_markers(signal, size):
+    """
+    Every position at which the last ``size`` characters are all different, as a NumPy array,
+    for batch analysis of whole captures rather than just the first marker.
+
+    For each byte the index of the previous occurrence of the same value comes from a stable sort
+    by value; a running maximum of those gives where the run of distinct bytes ending at each
+    position starts, with no Python loop over the stream.
+    """
+    import numpy as np
+
+    stream = np.frombuffer(loader.as_buffer(signal), dtype=np.uint8)
+    order = np.argsort(stream, kind='stable')
+    previous = np.full(len(stream), -1, dtype=np.int64)
+    same_value = stream[order[1:]] == stream[order[:-1]]
+    previous[order[1:][same_value]] = order[:-1][same_value]
+
+    run_start = np.maximum.accumulate(previous + 1) if len(stream) else previous
+    run_length = np.arange(len(stream)) - run_start + 1
+    return np.flatnonzero(run_length >= size) + 1
+
+
+@loader.takes_bytes
+def parse(data):
+    # One pass over the datastream (the first line) finds both markers
+    return find_markers(loader.lines(data)[0])
+
+
+def part1(markers):
+    return markers[4]
+
+
+def part2(markers):
+    return markers[14]
+
+
+def main():
+    markers = scan_file('input.txt')
+    print("part 1 solution:", markers[4])
+    print("part 2 solution:", markers[14])
+
+
+if __name__ == "__main__":
+    main()
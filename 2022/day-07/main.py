@@ -0,0 +1,127 @@
+# Based on https://medium.com/@datasciencedisciple/advent-of-code-2022-in-python-day-7-47a94b090949 fpr part 1, part2 independent
+
+import bisect
+from array import array
+from itertools import accumulate
+
+DISK_SIZE = 70000000
+SPACE_NEEDED = 30000000
+
+
+class DirectoryTree:
+    """
+    The file system seen in a terminal transcript, indexed by integer directory ids.
+
+    Directory 0 is the root; every other directory has a parent id, a name and a dict of its
+    subdirectories by name. A file line adds its size to the current directory only, and once
+    the transcript has been read every directory's total rolls up into its parent exactly once.
+    Children are always created after their parents, so a single pass over the ids from last to
+    first finishes each directory before its parent: linear in the size of the transcript.
+
+    Queries run on the directory sizes sorted once, with prefix sums, so each is a binary search.
+    """
+
+    ROOT = 0
+
+    def __init__(self):
+        self.parents = array('l', [-1])
+        self.names = ['/']
+        self.children = [{}]
+        self.sizes = array('q', [0])
+
+    def __len__(self):
+        return len(self.parents)
+
+    def child(self, directory, name):
+        """The id of a subdirectory, created on first sight."""
+        child = self.children[directory].get(name)
+        if child is None:
+            child = len(self.parents)
+            self.children[directory][name] = child
+            self.parents.append(directory)
+            self.names.append(name)
+            self.children.append({})
+            self.sizes.append(0)
+        return child
+
+    def path(self, directory):
+        names = []
+        while directory != self.ROOT:
+            names.append(self.names[directory])
+            directory = self.parents[directory]
+        return "/" + "/".join(reversed(names))
+
+    @classmethod
+    def from_transcript(cls, lines):
+        tree = cls()
+        current = cls.ROOT
+        for line in lines:
+            if not line:
+                continue
+            if line.startswith("$ cd"):
+                name = line[5:].strip()
+                if name == "/":
+                    current = cls.ROOT
+                elif name == "..":
+                    # The root is its own parent, as far as `cd ..` is concerned
+                    current = max(tree.parents[current], cls.ROOT)
+                else:
+                    current = tree.child(current, name)
+            elif line[0].isdigit():
+                tree.sizes[current] += int(line.split(maxsplit=1)[0])
+
+        # Roll each directory's total up into its parent, deepest (latest created) first
+        parents, sizes = tree.parents, tree.sizes
+        for directory in range(len(tree) - 1, 0, -1):
+            sizes[parents[directory]] += sizes[directory]
+        tree.index_sizes()
+        return tree
+
+    def index_sizes(self):
+        """Sort the directories by total size, for the queries below."""
+        self.by_size = sorted(range(len(self)), key=self.sizes.__getitem__)
+        self.sorted_sizes = array('q', (self.sizes[directory] for directory in self.by_size))
+        self.size_prefix_sums = array('q', accumulate(self.sorted_sizes, initial=0))
+
+    def total_size(self):
+        return self.sizes[self.ROOT]
+
+    def sum_at_most(self, limit):
+        """The sum of the sizes of every directory of at most ``limit`` bytes."""
+        return self.size_prefix_sums[bisect.bisect_right(self.sorted_sizes, limit)]
+
+    def smallest_at_least(self, minimum):
+        """The id of the smallest directory of at least ``minimum`` bytes, or None."""
+        i = bisect.bisect_left(self.sorted_sizes, minimum)
+        return self.by_size[i] if i < len(self.by_size) else None
+
+
+def parse(text):
+    return DirectoryTree.from_transcript(text.splitlines())
+
+
+def part1(tree):
+    return tree.sum_at_most(100000)
+
+
+def find_directory_to_delete(tree):
+    free_space = DISK_SIZE - tree.total_size()
+    shortfall = SPACE_NEEDED - free_space
+    directory = tree.smallest_at_least(shortfall)
+    return tree.path(directory), tree.sizes[directory]
+
+
+def part2(tree):
+    return find_directory_to_delete(tree)[1]
+
+
+def main():
+    with open('input.txt', 'r')as f:
+        tree = parse(f.read())
+    print("part 1 solution is: %d " % part1(tree))
+    target_dir = find_directory_to_delete(tree)
+    print("part 2 solution is: %s %d " % (target_dir[0], target_dir[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+read input as an array
+
+ for each item:
+
+set border_tree = first entry
+add count border_tree to visible_trees
+if next_tree is =<border_tree and < any tree to right and < any tree above in column and < any tree below in column:
+    add to hidden_trees
+elif next_tree is >border_tree and > any tree to right  and > any tree above in column and > any tree below in column
+    add next_tree to visible_trees
+add count last_tree to visible_trees
+ """
+
+
+import numpy as np
+
+from aoc import loader
+from aoc.grid import Grid
+
+# Tree heights are single digits
+HEIGHTS = 10
+
+
+def visible_from_left(matrix):
+    """
+    Which trees can be seen from the left edge: those taller than every tree to their left, i.e.
+    than the running maximum of their row shifted right by one column (-1 before the first).
+    """
+    tallest_before = np.full(matrix.shape, -1, dtype=np.int8)
+    np.maximum.accumulate(matrix[:, :-1], axis=1, out=tallest_before[:, 1:])
+    return matrix > tallest_before
+
+
+def visibility_mask(matrix):
+    """
+    Which trees can be seen from outside the grid, from any of the four edges. Every sweep runs
+    along contiguous rows; the columns are swept as the rows of one transposed copy.
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.int8)
+    visible = visible_from_left(matrix)
+    visible |= visible_from_left(matrix[:, ::-1])[:, ::-1]
+    columns = np.ascontiguousarray(matrix.T)
+    visible_in_columns = visible_from_left(columns)
+    visible_in_columns |= visible_from_left(columns[:, ::-1])[:, ::-1]
+    visible |= visible_in_columns.T
+    return visible
+
+
+def viewing_distances_up(matrix):
+    """
+    How many trees every tree can see looking up, i.e. the distance to the nearest tree at least
+    as tall above it, or to the edge.
+
+    A monotonic stack swept down a column holds the rows of the trees that can still block the
+    view, in decreasing height; with heights 0-9 it never holds more than one tree per height, so
+    its whole state is "the last row holding a tree at least h tall" for each h. That is computed
+    for every column at once with one running maximum per height, and each tree reads the entry
+    for its own height from the row above: O(n*m) overall, in whole-row array operations.
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.uint8)
+    rows = np.arange(matrix.shape[0], dtype=np.int32)[:, None]
+    distances = np.zeros(matrix.shape, dtype=np.int32)
+    blockers = np.zeros(matrix.shape, dtype=np.int32)
+    for height in range(HEIGHTS):
+        # The last row strictly above each tree with a tree at least this tall, or 0: a blocker
+        # in row 0 and the edge are the same distance away
+        np.multiply(matrix[:-1] >= height, rows[:-1], out=blockers[1:])
+        np.maximum.accumulate(blockers, axis=0, out=blockers)
+        np.subtract(rows, blockers, out=distances, where=matrix == height)
+    return distances
+
+
+def scenic_scores(matrix):
+    """The scenic score of every tree: the product of its viewing distances in all four directions."""
+    up = viewing_distances_up(matrix)
+    down = viewing_distances_up(matrix[::-1, :])[::-1, :]
+    left = viewing_distances_up(matrix.T).T
+    right = viewing_distances_up(matrix[:, ::-1].T).T[:, ::-1]
+    return up.astype(np.int64) * down * left * right
+
+
+@loader.takes_bytes
+def parse(data):
+    # The digits straight from the bytes into a (rows, columns) array of heights
+    return Grid.from_text(data).numpy() - ord('0')
+
+
+def part1(matrix):
+    return int(visibility_mask(matrix).sum())
+
+
+def part2(matrix):
+    return int(scenic_scores(matrix).max())
+
+
+def main():
+    # Read the file
+    with open('input.txt', 'r') as file:
+        matrix = parse(file.read())
+
+    visible_trees_count = part1(matrix)
+    print(f"Hidden Trees Count: {matrix.size - visible_trees_count}")
+    print(f"Visible Trees Count: {visible_trees_count}")
+
+    # Output the result
+    print(f"The maximum scenic score for any tree is {part2(matrix)}")
+
+
+if __name__ == "__main__":
+    main()
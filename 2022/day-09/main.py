@@ -0,0 +1,151 @@
+"""
+need to read into numpy array and encode rules
+
+ """
+
+#  based on https://galaxyinferno.com/how-to-solve-advent-of-code-2022-day-9-with-python/
+
+# (x, y) step for each direction the head can move
+DIRECTIONS = {'R': (1, 0), 'L': (-1, 0), 'U': (0, 1), 'D': (0, -1)}
+# Visited cells are packed into one int each, x above the low 32 bits and y in them, so that the
+# cells of a straight run are an arithmetic progression of keys
+Y_BITS = 32
+
+
+def pack(x, y):
+    return (x << Y_BITS) + y
+
+
+class Rope:
+    """
+    A rope of any number of knots, the head being knot 0, and the sets of cells visited by the
+    ``tracked`` knots (by default just the tail).
+
+    Knot positions are plain lists of ints; a step moves the head and then each knot towards the
+    one in front of it, stopping at the first knot that does not need to move, since none behind
+    it will either. Once a move has pulled the whole rope straight out behind the head, every
+    further step of that move shifts every knot by one, so the rest of the run is applied in one
+    go and the cells passed over are added as a range of packed keys.
+
+    Knot i of a long rope moves exactly as the tail of an (i + 1)-knot rope would, so tracking
+    several knots answers several rope lengths from the same pass.
+    """
+
+    def __init__(self, knots, tracked=None):
+        self.knots = knots
+        self.xs = [0] * knots
+        self.ys = [0] * knots
+        # visits[i] is the set of cells knot i visited, or None when knot i is not tracked
+        self.visits = [None] * knots
+        for i in [knots - 1] if tracked is None else tracked:
+            self.visits[i] = {pack(0, 0)}
+
+    @property
+    def visited(self):
+        """The cells the tail visited, if it is tracked."""
+        return self.visits[-1]
+
+    def visit_counts(self):
+        """The number of distinct cells each knot visited, head first; None for untracked knots."""
+        return [None if visited is None else len(visited) for visited in self.visits]
+
+    def is_straight(self, dx, dy):
+        """Whether every knot sits one step behind the knot in front of it, along (dx, dy)."""
+        xs, ys = self.xs, self.ys
+        return all(xs[i] == xs[i - 1] - dx and ys[i] == ys[i - 1] - dy for i in range(1, self.knots))
+
+    def move(self, direction, distance):
+        dx, dy = DIRECTIONS[direction]
+        xs, ys = self.xs, self.ys
+        visits = self.visits
+        knots = self.knots
+        last = knots - 1
+        while distance > 0:
+            distance -= 1
+            x = xs[0] = xs[0] + dx
+            y = ys[0] = ys[0] + dy
+            visited = visits[0]
+            if visited is not None:
+                visited.add(pack(x, y))
+            for i in range(1, knots):
+                tx, ty = xs[i], ys[i]
+                gap_x, gap_y = x - tx, y - ty
+                if -1 <= gap_x <= 1 and -1 <= gap_y <= 1:
+                    break
+                # Close the gap by one in each direction it is open
+                x = xs[i] = tx + (gap_x > 0) - (gap_x < 0)
+                y = ys[i] = ty + (gap_y > 0) - (gap_y < 0)
+                visited = visits[i]
+                if visited is not None:
+                    visited.add(pack(x, y))
+            else:
+                # The tail moved; a cheap necessary condition for a straight rope is the tail as
+                # far behind the head as it can be
+                if (distance and x == xs[0] - last * dx and y == ys[0] - last * dy
+                        and self.is_straight(dx, dy)):
+                    self.skip(dx, dy, distance)
+                    return
+
+    def skip(self, dx, dy, distance):
+        """Move the whole, straight, rope ``distance`` steps along (dx, dy)."""
+        delta = pack(dx, dy)
+        for x, y, visited in zip(self.xs, self.ys, self.visits):
+            if visited is not None:
+                start = pack(x, y)
+                visited.update(range(start + delta, start + (distance + 1) * delta, delta))
+        shift_x, shift_y = distance * dx, distance * dy
+        self.xs = [x + shift_x for x in self.xs]
+        self.ys = [y + shift_y for y in self.ys]
+
+
+def read_motions(text):
+    # read input by line and generate list of tuples for letter and number following it)
+    return [(entry.strip().split(' ')[0],
+             int(entry.strip().split(' ')[1])
+             )
+            for entry in text.splitlines() if entry.strip()]
+
+
+def tail_positions(movements, knots):
+    """The (packed) cells visited by the tail of a rope of ``knots`` knots."""
+    rope = Rope(knots)
+    for direction, distance in movements:
+        rope.move(direction, distance)
+    return rope.visited
+
+
+def visit_counts(movements, knots, tracked=None):
+    """
+    How many cells each knot of a ``knots``-knot rope visited, head first, from one pass: every
+    knot by default, or just the ``tracked`` ones (None for the rest). Entry i is also the answer
+    for the tail of an (i + 1)-knot rope.
+    """
+    rope = Rope(knots, range(knots) if tracked is None else tracked)
+    for direction, distance in movements:
+        rope.move(direction, distance)
+    return rope.visit_counts()
+
+
+def parse(text):
+    # Both ropes come out of a single traversal with the longer one
+    return visit_counts(read_motions(text), 10, tracked=(1, 9))
+
+
+def part1(counts):
+    # The tail of a 2 knot rope is knot 1 of the 10 knot rope
+    return counts[1]
+
+
+def part2(counts):
+    return counts[9]
+
+
+def main():
+    with open('input.txt', 'r') as f:
+        counts = parse(f.read())
+    print(f"number of positions visited by the tail of a 2 knot rope is {counts[1]}")
+    print(f"number of positions visited by the tail of a 10 knot rope is {counts[9]}")
+
+
+if __name__ == "__main__":
+    main()
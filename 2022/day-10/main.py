@@ -23,69 +23,34 @@ This system ensures that each clock cycle evaluates the sprite's visibility for
 
 """
 
+from aoc import cpu
 
-# define iterator (ordered dict)
-cycles = {}
-cycle_counter = 0
-x = 1  # Register X starts at 1
+# Find the signal strength during the 20th, 60th, 100th, 140th, 180th, and 220th cycles
+CYCLES_OF_INTEREST = [20, 60, 100, 140, 180, 220]
 
 
-with open('input.txt', 'r') as file:
+def parse(text):
+    # X during every cycle, from the program compiled to per-cycle deltas
+    return cpu.trace(cpu.compile_program(text.splitlines()))
 
-    for line in file:
 
-        line = line.strip()
+def part1(xs):
+    # What is the sum of these six signal strengths?
+    return cpu.signal_strength(xs, CYCLES_OF_INTEREST)
 
-        if line == 'noop':
-            # noop takes 1 cycle, X doesn't change
-            cycle_counter += 1
-            cycles[cycle_counter] = x  # Record X value for this cycle
 
-        elif line.startswith('addx'):
-            # addx takes 2 cycles to complete
-            cycle_counter += 1
-            cycles[cycle_counter] = x  # Record X before the change (1st cycle)
+def part2(xs):
+    # Return the screen, each row as a string
+    return cpu.render(cpu.crt(xs))
 
-            cycle_counter += 1
-            cycles[cycle_counter] = x  # Record X again (2nd cycle)
 
-            # Update X after 2 cycles
-            _, value = line.split()
-            x += int(value)
+def main():
+    with open('input.txt', 'r') as file:
+        xs = parse(file.read())
 
-# Find the signal strength during the 20th, 60th, 100th, 140th, 180th, and 220th cycles. What is the sum of these six signal strengths?
+    print("part 1 answer:", part1(xs))
+    print(part2(xs))
 
-cycles_of_interest = [20, 60, 100, 140, 180, 220]
 
-sum_of_signal_strengths = 0
-
-# Get the signal strength for each cycle of interest and sum them
-for cycle in cycles_of_interest:
-    sum_of_signal_strengths += cycles[cycle]*cycle
-
-print("part 1 answer:", sum_of_signal_strengths)
-
-
-# 2D Array (Screen) - 40 pixels wide
-screen = [[' ' for _ in range(40)] for _ in range(6)]
-
-# Mapping Columns to Clock Cycles
-for cycle in cycles:
-    # Sprite Position (Controlled by X)
-    x = cycles[cycle]
-
-    # Sprite Visibility Check
-for cycle, x in cycles.items():
-    # Calculate row and column for the current cycle
-    row = (cycle - 1) // 40  # Which row the cycle falls into
-    col = (cycle - 1) % 40   # Which column the cycle falls into
-
-    # Make sure we're within screen bounds
-    if row < 6:
-        # Check if the current column is within the sprite's range (X-1, X, X+1)
-        if col in [x-1, x, x+1]:
-            screen[row][col] = '#'  # Render a lit pixel
-
-# Print the screen
-for row in screen:
-    print(''.join(row))  # Print each row as a string
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,7 @@
 import operator
 import math
 
-monkeys = []
-worry_levels = {}
-# Dictionary to store monkey instances by their IDs for easy access
-inspections = {}  # Dictionary to track the number of inspections per round
-monkey_dict = {}
-challenge_part = 2  # 1 or 2 - depending on which part of the challenge we are tackling
-
-if challenge_part == 1:
-    rounds = 20
-elif challenge_part == 2:
-    rounds = 10000
+from aoc import cycles
 
 
 # need to calculate the Lowest Common Multiple of all the monkeys' inspect_test values to limit the growth of worry levels bringing the system to a halt
@@ -57,31 +47,19 @@ class Monkey:
             return self.is_false
 
 
-def create_monkey_instance(input_file):
-    with open(input_file, 'r') as file:
-        lines = file.readlines()
+def parse(text):
+    lines = text.splitlines()
+    monkey_specs = []
 
     for i in range(0, len(lines), 7):
         name = int(lines[i].split()[1][:-1])
         starting_items = [int(item.strip()) for item in lines[i + 1].split(':')[1].split(',')]
 
-        operator_mapping = {
-            '+': operator.add,
-            '-': operator.sub,
-            '*': operator.mul,
-            '/': operator.truediv,
-        }
-
         operation_precursor = lines[i + 2].split('=', 1)
         operation = operation_precursor[1].split()
         operation_operator = operation[1]
         operation_value = (operation[2])
 
-        if operation_value == 'old':
-            new_op = lambda x, op=operator_mapping[operation_operator]: op(x, x)
-        else:
-            new_op = lambda x, op=operator_mapping[operation_operator], val=int(operation_value): op(x, val)
-
         inspect_precursor = lines[i + 3].split(':')
         inspect_precursor_two = inspect_precursor[1].split()
         inspect_test = int(inspect_precursor_two[2])
@@ -89,47 +67,97 @@ def create_monkey_instance(input_file):
         is_true = int(lines[i + 4].split()[5])
         is_false = int(lines[i + 5].split()[5])
 
-        monkey = Monkey(name, starting_items, new_op, inspect_test, is_true, is_false, challenge_part, 0)  # Temp 0 for now
-        monkeys.append(monkey)
-        monkey_dict[name] = monkey
-
-
-def play_round(round_num):
-    inspections[round_num] = {monkey.name: 0 for monkey in monkeys}
-
-    for monkey in monkeys:
-        new_items = []
-        for item in monkey.items:
-            new_worry_level = monkey.inspect_item(item)
-            next_monkey_id = monkey.test(new_worry_level)
-
-            monkey_dict[next_monkey_id].items.append(new_worry_level)
-            worry_levels.setdefault(monkey.name, {}).setdefault(next_monkey_id, []).append(new_worry_level)
+        monkey_specs.append((name, starting_items, operation_operator, operation_value, inspect_test, is_true, is_false))
+    return monkey_specs
 
-            inspections[round_num][monkey.name] += 1
-            inspections_total[monkey.name] += 1
 
-        monkey.items = new_items  # Clear monkey's items after processing
+def create_monkey_instances(monkey_specs, challenge_part):
+    operator_mapping = {
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.truediv,
+    }
 
+    monkeys = []
+    for name, starting_items, operation_operator, operation_value, inspect_test, is_true, is_false in monkey_specs:
+        if operation_value == 'old':
+            new_op = lambda x, op=operator_mapping[operation_operator]: op(x, x)
+        else:
+            new_op = lambda x, op=operator_mapping[operation_operator], val=int(operation_value): op(x, val)
 
-def main():
-    create_monkey_instance('input.txt')
+        # copy the starting items so every part starts from the parsed state
+        monkey = Monkey(name, list(starting_items), new_op, inspect_test, is_true, is_false, challenge_part, 0)  # Temp 0 for now
+        monkeys.append(monkey)
 
     lcm_value = calculate_lcm_of_monkeys(monkeys)
     for monkey in monkeys:
         monkey.lcm_value = lcm_value  # Set the LCM for each monkey
-
-    global inspections_total
+    return monkeys
+
+
+def throw_item(monkey_dict, state):
+    """
+    Follows one item through a round. Each monkey it reaches inspects it and throws it on; landing
+    with a monkey later in the order means it is handled again in the same round.
+
+    Returns the item's (monkey, worry level) at the start of the next round, and how many times
+    each monkey inspected it during this one.
+    """
+    monkey_id, worry_level = state
+    inspections = [0] * len(monkey_dict)
+    while True:
+        monkey = monkey_dict[monkey_id]
+        worry_level = monkey.inspect_item(worry_level)
+        inspections[monkey_id] += 1
+        next_monkey_id = monkey.test(worry_level)
+        if next_monkey_id < monkey_id:
+            return (next_monkey_id, worry_level), tuple(inspections)
+        monkey_id = next_monkey_id
+
+
+def monkey_business(monkey_specs, challenge_part):
+    # 1 or 2 - depending on which part of the challenge we are tackling
+    if challenge_part == 1:
+        rounds = 20
+    elif challenge_part == 2:
+        rounds = 10000
+
+    monkeys = create_monkey_instances(monkey_specs, challenge_part)
+    # Dictionary to store monkey instances by their IDs for easy access
+    monkey_dict = {monkey.name: monkey for monkey in monkeys}
     inspections_total = {monkey.name: 0 for monkey in monkeys}
 
-    for i in range(rounds):
-        play_round(i + 1)
-        print(f"Round {i + 1} completed")
+    # Items never affect each other, so each one is followed on its own. With worry levels kept
+    # modulo the LCM an item's (monkey, worry level) repeats within a few hundred rounds, and the
+    # cycle engine extrapolates its inspections over the rest (see aoc.cycles).
+    for monkey in monkeys:
+        for item in monkey.items:
+            inspections = cycles.accumulate(
+                (monkey.name, item), lambda state: throw_item(monkey_dict, state), rounds
+            )
+            for name, count in enumerate(inspections):
+                inspections_total[name] += count
 
     inspection_totals = [total for total in inspections_total.values()]
     score = sorted(inspection_totals, reverse=True)
-    product_score = score[0] * score[1]
-    print(product_score)
+    return score[0] * score[1]
+
+
+def part1(monkey_specs):
+    return monkey_business(monkey_specs, 1)
+
+
+def part2(monkey_specs):
+    return monkey_business(monkey_specs, 2)
+
+
+def main():
+    with open('input.txt', 'r') as file:
+        monkey_specs = parse(file.read())
+
+    print(part1(monkey_specs))
+    print(part2(monkey_specs))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+
+from aoc import search
+from aoc.grid import Grid
+
+
+# Border cells are this high, so no path ever steps off the map
+BORDER = 0xFF
+
+
+class GridProcessor:
+    """
+    The height map as a padded flat byte grid of elevations 0 ('a') to 25 ('z'); positions are flat
+    indices into it, so neighbours are just ``position + offset`` with no bounds checks.
+    """
+
+    def __init__(self, text):
+        self.grid = self.read_input(text)
+        self.start, self.end = self.find_start_end(self.grid)
+        self.elevation_grid = self.map_elevations(self.grid)
+
+    def read_input(self, text):
+        # One byte per square, surrounded by a border that can never be climbed
+        return Grid.from_text(text).padded(BORDER)
+
+    def find_start_end(self, grid):
+        return grid.find(ord('S')), grid.find(ord('E'))
+
+    def find_lows(self):
+        return self.elevation_grid.positions(0)
+
+    def map_elevations(self, grid):
+        """
+        Translate every letter to its elevation with a 256-entry byte table: 'a' to 'z' become
+        0 to 25 via ord(), 'S' is treated as 'a' and 'E' as 'z'; the border byte is left alone.
+        """
+        elevation_map = bytearray(range(256))
+        for i in range(ord('a'), ord('z') + 1):
+            elevation_map[i] = i - ord('a')
+
+        # Override 'S' and 'E' values to their respective elevations
+        elevation_map[ord('S')] = elevation_map[ord('a')]  # 'S' is treated as 'a', so its elevation is 0
+        elevation_map[ord('E')] = elevation_map[ord('z')]  # 'E' is treated as 'z', so its elevation is 25
+
+        return Grid(grid.width, grid.height, grid.cells.translate(elevation_map))
+
+    def find_path_part_1(self):
+        return self.find_path(self.start)
+
+    def find_path_part_2(self):
+        # One search from every lowest square at once finds the nearest of them
+        return self.find_path(self.find_lows())
+
+    def climbable(self, position):
+        """The squares next to ``position`` at most one higher; the border keeps them all inside the grid."""
+        elevations = self.elevation_grid.cells
+        limit = elevations[position] + 1
+        return [position + offset for offset in self.elevation_grid.offsets
+                if elevations[position + offset] <= limit]
+
+    def find_path(self, starting_points):
+        """
+        Breadth-first search (every step costs 1) from one or more starting squares, stopping at
+        the end square; returns the number of steps or None if the end cannot be reached.
+        """
+        size = len(self.elevation_grid)
+        return search.bfs(size, starting_points, self.climbable, goal=self.end).distance
+
+
+def parse(text):
+    return GridProcessor(text)
+
+
+def part1(grid_processor):
+    return grid_processor.find_path_part_1()
+
+
+def part2(grid_processor):
+    return grid_processor.find_path_part_2()
+
+
+def main():
+    with open('./input.txt', 'r') as file:
+        grid_processor = parse(file.read())
+    print("Part 1:", part1(grid_processor))
+    print("Part 2:", part2(grid_processor))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,6 @@
-from itertools import islice
-import ast
+import json
 
-# Create a dictionary to store the packets
-packets = {}
-
-# Create a list to store the indices of the correct packets
-correct_packets = []
-
-# Create a list of packets to sort them for part 2, seeded with proscripted dividers values
-ordered_packets = [[[2]], [[6]]]
+from aoc import loader
 
 # When comparing two values, the first value is called left and the second value is called right. Then:
 # - If both values are integers, the lower integer should come first. If the left integer is lower than the right integer, the inputs are in the right order. If the left integer is higher than the right integer, the inputs are not in the right order. Otherwise, the inputs are the same integer; continue checking the next part of the input.
@@ -87,46 +79,51 @@ class ListSorter:
         return indices
 
 
-def main():
-    # Open the file and read it line by line
-    with open('./input.txt', 'r') as file:
-        # Initialize the group counter
-        group_counter = 1
-
-        # Process file in chunks of three lines
-        while True:
-            # Use islice to get the next three lines
-            lines = list(islice(file, 3))
+@loader.takes_bytes
+def parse(data):
+    # Create a dictionary to store the packets, keyed by group number
+    packets = {}
 
-            if not lines:  # Break if no lines left
-                break
+    # Each blank-line separated block holds a pair of packets, which are valid JSON
+    for group_counter, block in enumerate(loader.blocks(data), 1):
+        left, right = loader.lines(block)
+        packets[group_counter] = [json.loads(left.tobytes()), json.loads(right.tobytes())]
+    return packets
 
-            # Store the first line and the second line in a list as the value for the key by group in dict packets
-            packets[group_counter] = [ast.literal_eval(lines[0].strip()), ast.literal_eval(lines[1].strip())]
 
-            # Increment the group counter
-            group_counter += 1
+def part1(packets):
+    # Create a list to store the indices of the correct packets
+    correct_packets = []
 
     # Process each packet and compare
     for packet_num in packets:
         left_packet, right_packet = packets[packet_num]
         result = compare(left_packet, right_packet)
-        # print(f"Packet {packet_num}: {'True' if result else 'False'}")
         if result:
             correct_packets.append(packet_num)
+    return sum(correct_packets)
 
-        # Sort the packets for part 2
+
+def part2(packets):
+    # Create a list of packets to sort them for part 2, seeded with proscripted dividers values
+    ordered_packets = [[[2]], [[6]]]
+    for left_packet, right_packet in packets.values():
         ordered_packets.append(left_packet)
         ordered_packets.append(right_packet)
-    print(f"Part 1 solution: {sum(correct_packets)}")
 
     # Instantiate the ListSorter class
     sorter = ListSorter(ordered_packets)
 
     # Find the index positions of [[[2]]] and [[[6]]]
     indices = sorter.find_indices_of_static_items()
+    return indices[0] * indices[1]
+
+
+def main():
+    packets = parse(loader.load('./input.txt'))
 
-    print("Part 2 solution:", (indices[0] * indices[1]))
+    print(f"Part 1 solution: {part1(packets)}")
+    print("Part 2 solution:", part2(packets))
 
 
 if __name__ == "__main__":
@@ -1,17 +1,23 @@
-def parse_input(file_path):
+from aoc import loader
+from aoc.grid import Grid
+
+AIR, ROCK, SAND, SOURCE = b".#o+"
+
+
+@loader.takes_bytes
+def parse(data):
     """
-    Parses the input file and returns a list of unique rock paths.
+    Parses the puzzle input and returns a list of unique rock paths.
     Each path is a list of (x, y) tuples.
     """
     paths = []
     unique_paths = set()
-    with open(file_path, 'r') as file:
-        for line in file:
-            # Convert each path to a tuple of tuples for immutability
-            path = tuple(tuple(map(int, segment.split(","))) for segment in line.strip().split(" -> "))
-            if path not in unique_paths:
-                unique_paths.add(path)
-                paths.append(list(path))
+    for numbers in loader.ints_per_line(data):
+        # Pair up the x,y numbers of each line into a tuple of tuples for immutability
+        path = tuple(zip(numbers[::2], numbers[1::2]))
+        if path not in unique_paths:
+            unique_paths.add(path)
+            paths.append(list(path))
     return paths
 
 
@@ -52,16 +58,14 @@ def initialize_grid(min_x, max_x, min_y, max_y):
     """
     width = max_x - min_x + 1
     height = max_y - min_y + 1
-    return [['.' for _ in range(width)] for _ in range(height)]
+    return Grid.filled(width, height, AIR)
 
 
 def place_source(grid, source_x, source_y, min_x, min_y):
     """
     Places the sand source '+' in the grid.
     """
-    adjusted_x = source_x - min_x
-    adjusted_y = source_y - min_y
-    grid[adjusted_y][adjusted_x] = '+'
+    grid.set(source_y - min_y, source_x - min_x, SOURCE)
 
 
 def draw_rocks(grid, paths, min_x, min_y):
@@ -75,11 +79,12 @@ def draw_rocks(grid, paths, min_x, min_y):
             if start[0] == end[0]:  # Vertical line
                 x = start[0] - min_x
                 for y in range(min(start[1], end[1]), max(start[1], end[1]) + 1):
-                    grid[y - min_y][x] = '#'
+                    grid.set(y - min_y, x, ROCK)
             elif start[1] == end[1]:  # Horizontal line
                 y = start[1] - min_y
-                for x in range(min(start[0], end[0]), max(start[0], end[0]) + 1):
-                    grid[y][x - min_x] = '#'
+                first = grid.index(y, min(start[0], end[0]) - min_x)
+                last = grid.index(y, max(start[0], end[0]) - min_x)
+                grid.cells[first:last + 1] = bytes([ROCK]) * (last - first + 1)
 
 
 def draw_floor(grid, min_x, min_y, floor_y):
@@ -87,73 +92,73 @@ def draw_floor(grid, min_x, min_y, floor_y):
     Draws the floor '#' on the grid at the specified floor_y.
     """
     y = floor_y - min_y
-    if y >= len(grid):
-        raise IndexError(f"Floor y-coordinate {floor_y} is outside the grid height {len(grid)}.")
-    for x in range(len(grid[y])):
-        grid[y][x] = '#'
+    if y >= grid.height:
+        raise IndexError(f"Floor y-coordinate {floor_y} is outside the grid height {grid.height}.")
+    first = grid.index(y, 0)
+    grid.cells[first:first + grid.width] = bytes([ROCK]) * grid.width
 
 
 def print_grid(grid):
     """
     Prints the grid to the console.
     """
-    for row in grid:
-        print("".join(row))
+    print(grid)
 
 
 def simulate_sand_falling_part1(cave, source_x, source_y, min_x, min_y):
     """
     Simulates sand falling until a unit falls into the abyss.
     Returns the number of sand units that come to rest.
+
+    Works on flat indices into the cave's cells: one row down is ``+ width``.
     """
-    width = len(cave[0])
-    height = len(cave)
+    cells = cave.cells
+    width = cave.width
+    height = cave.height
+    source = cave.index(source_y - min_y, source_x - min_x)
     sand_count = 0
 
     while True:
         # Start sand at the source
-        x, y = source_x - min_x, source_y - min_y
+        i = source
 
         # Check if the source is already blocked
-        if cave[y][x] != '+' and cave[y][x] != '.':
+        if cells[i] != SOURCE and cells[i] != AIR:
             # Source is blocked; simulation ends (Not applicable for Part 1)
             return sand_count
 
         while True:
+            below = i + width
             # Stop the simulation if sand falls out of bounds (into the abyss)
-            if y + 1 >= height:
+            if below >= width * height:
                 return sand_count
 
             # Check if the space directly below is empty
-            if cave[y + 1][x] == '.':
-                y += 1  # Move down
-            else:
-                moved = False
-
-                # Attempt to move down-left
-                if x - 1 < 0:
-                    # Sand flows into the abyss to the left
-                    return sand_count
-                elif cave[y + 1][x - 1] == '.':
-                    y += 1
-                    x -= 1  # Move down-left
-                    moved = True
-
-                # Attempt to move down-right
-                if not moved:
-                    if x + 1 >= width:
-                        # Sand flows into the abyss to the right
-                        return sand_count
-                    elif cave[y + 1][x + 1] == '.':
-                        y += 1
-                        x += 1  # Move down-right
-                        moved = True
-
-                if not moved:
-                    # Sand comes to rest when all three options are blocked
-                    cave[y][x] = 'o'
-                    sand_count += 1
-                    break  # Start simulating the next unit of sand
+            if cells[below] == AIR:
+                i = below  # Move down
+                continue
+
+            x = i % width
+            # Attempt to move down-left
+            if x == 0:
+                # Sand flows into the abyss to the left
+                return sand_count
+            if cells[below - 1] == AIR:
+                i = below - 1
+                continue
+
+            # Attempt to move down-right
+            if x + 1 >= width:
+                # Sand flows into the abyss to the right
+                return sand_count
+            if cells[below + 1] == AIR:
+                i = below + 1
+                continue
+
+            # Sand comes to rest when all three options are blocked
+            cells[i] = SAND
+            sand_count += 1
+            break  # Start simulating the next unit of sand
 
 
 def simulate_sand_falling_part2(cave, source_x, source_y, min_x, min_y, floor_y):
@@ -161,49 +166,43 @@ def simulate_sand_falling_part2(cave, source_x, source_y, min_x, min_y, floor_y)
     Simulates sand falling with a floor until the source is blocked.
     Returns the number of sand units that come to rest.
     """
-    width = len(cave[0])
-    height = len(cave)
+    cells = cave.cells
+    width = cave.width
+    source = cave.index(source_y - min_y, source_x - min_x)
+    # Any index past the start of the row above the floor is resting on the floor
+    floor_start = cave.index(floor_y - min_y - 1, 0)
     sand_count = 0
 
     while True:
         # Start sand at the source
-        x, y = source_x - min_x, source_y - min_y
+        i = source
 
         # Check if the source is already blocked
-        if cave[y][x] == 'o':
+        if cells[i] == SAND:
             # Source is blocked; simulation ends
             return sand_count
 
         while True:
-            # If y + 1 is the floor level, sand comes to rest
-            if y + 1 == floor_y - min_y:
-                cave[y][x] = 'o'
+            # If the next row is the floor, sand comes to rest
+            if i >= floor_start:
+                cells[i] = SAND
                 sand_count += 1
                 break
 
-            # Check if the space directly below is empty
-            if cave[y + 1][x] == '.':
-                y += 1  # Move down
+            below = i + width
+            x = i % width
+            # Check if the space directly below is empty, then down-left, then down-right
+            if cells[below] == AIR:
+                i = below
+            elif x > 0 and cells[below - 1] == AIR:
+                i = below - 1
+            elif x + 1 < width and cells[below + 1] == AIR:
+                i = below + 1
             else:
-                moved = False
-
-                # Attempt to move down-left
-                if x - 1 >= 0 and cave[y + 1][x - 1] == '.':
-                    y += 1
-                    x -= 1  # Move down-left
-                    moved = True
-
-                # Attempt to move down-right
-                if not moved and x + 1 < width and cave[y + 1][x + 1] == '.':
-                    y += 1
-                    x += 1  # Move down-right
-                    moved = True
-
-                if not moved:
-                    # Sand comes to rest when all three options are blocked
-                    cave[y][x] = 'o'
-                    sand_count += 1
-                    break  # Start simulating the next unit of sand
+                # Sand comes to rest when all three options are blocked
+                cells[i] = SAND
+                sand_count += 1
+                break  # Start simulating the next unit of sand
 
 
 def simulate_sand_in_cave_part1(cave, min_x, min_y):
@@ -230,14 +229,7 @@ def simulate_sand_in_cave_part2(cave, min_x, min_y, floor_y):
     return simulate_sand_falling_part2(cave, source_x, source_y, min_x, min_y, floor_y)
 
 
-def main():
-    file_path = 'input.txt'  # Path to the input file
-    paths = parse_input(file_path)
-
-    # ================================
-    # Part One Simulation
-    # ================================
-
+def part1(paths):
     # Step 1: Determine grid size based on paths and source (Part One)
     min_x1, max_x1, min_y1, max_y1 = determine_grid_size(paths, add_floor=False)
 
@@ -252,16 +244,15 @@ def main():
 
     # Step 5: Simulate sand falling for Part One and count how many units come to rest
     sand_units_part1 = simulate_sand_in_cave_part1(grid_part1, min_x1, min_y1)
-    print(f"Part One - Number of units of sand that come to rest: {sand_units_part1}")
 
     # Optional: Uncomment to visualize Part One grid
     # print("\nPart One Grid:")
     # print_grid(grid_part1)
 
-    # ================================
-    # Part Two Simulation
-    # ================================
+    return sand_units_part1
+
 
+def part2(paths):
     # Step 1: Determine grid size based on paths and source (Part Two)
     min_x2, max_x2, min_y2, max_y2 = determine_grid_size(paths, add_floor=True)
     floor_y = max_y2  # Correct calculation: floor_y is already set to max_y + 2 in determine_grid_size
@@ -276,20 +267,24 @@ def main():
     draw_rocks(grid_part2, paths, min_x2, min_y2)
 
     # Step 5: Draw the floor on the grid (Part Two)
-    try:
-        draw_floor(grid_part2, min_x2, min_y2, floor_y)
-    except IndexError as e:
-        print(f"Error drawing floor: {e}")
-        return
+    draw_floor(grid_part2, min_x2, min_y2, floor_y)
 
     # Step 6: Simulate sand falling for Part Two and count how many units come to rest
     sand_units_part2 = simulate_sand_in_cave_part2(grid_part2, min_x2, min_y2, floor_y)
-    print(f"Part Two - Number of units of sand that come to rest: {sand_units_part2}")
 
     # Optional: Uncomment to visualize Part Two grid
     # print("\nPart Two Grid:")
     # print_grid(grid_part2)
 
+    return sand_units_part2
+
+
+def main():
+    paths = parse(loader.load('input.txt'))  # Path to the input file
+
+    print(f"Part One - Number of units of sand that come to rest: {part1(paths)}")
+    print(f"Part Two - Number of units of sand that come to rest: {part2(paths)}")
+
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,4 @@
-# Define the path to your input file
-file_path = 'input.txt'
-
-# Initialize lists to store sensor and beacon positions
-sensor_positions = []
-beacon_positions = []
+from aoc import loader
 
 # Constants for the specific row to check in Part 1 and the grid limit for Part 2
 row_to_check = 2000000  # For Part 1
@@ -24,15 +19,16 @@ def manhattan_distance(p1, p2):
     return abs(p1[0] - p2[0]) + abs(p1[1] - p2[1])
 
 
-def parse_input(file_path):
+@loader.takes_bytes
+def parse(data):
     """
-    Parse the input file to extract sensor and beacon positions.
+    Parse the puzzle input to extract sensor and beacon positions.
 
-    Each line in the input file is expected to be in the format:
+    Each line in the input is expected to be in the format:
     "Sensor at x=<x1>, y=<y1>: closest beacon is at x=<x2>, y=<y2>"
 
     Parameters:
-    - file_path: str representing the path to the input file.
+    - data: the input file's bytes (see aoc.loader), or its text.
 
     Returns:
     - Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
@@ -41,29 +37,15 @@ def parse_input(file_path):
     """
     sensors = []
     beacons = []
-    with open(file_path, 'r') as file:
-        for line in file:
-            # Split the line into sensor and beacon parts
-            parts = line.strip().split(':')
-
-            # Parse sensor coordinates
-            sensor_part = parts[0].split('at')[1].strip()
-            # Remove commas and split into x and y
-            sensor_coords = sensor_part.replace(',', '').replace('x=', '').replace('y=', '').split()
-            sensor_x, sensor_y = map(int, sensor_coords)
-            sensors.append((sensor_x, sensor_y))
-
-            # Parse beacon coordinates
-            beacon_part = parts[1].split('at')[1].strip()
-            # Remove commas and split into x and y
-            beacon_coords = beacon_part.replace(',', '').replace('x=', '').replace('y=', '').split()
-            beacon_x, beacon_y = map(int, beacon_coords)
-            beacons.append((beacon_x, beacon_y))
+    # The four integers on each line are the sensor x, y and the beacon x, y
+    for sensor_x, sensor_y, beacon_x, beacon_y in loader.ints_per_line(data):
+        sensors.append((sensor_x, sensor_y))
+        beacons.append((beacon_x, beacon_y))
 
     return sensors, beacons
 
 
-def part_1(sensor_positions, beacon_positions):
+def part1(parsed):
     """
     Part 1: Count the number of positions in a specific row where a beacon cannot exist.
 
@@ -72,12 +54,12 @@ def part_1(sensor_positions, beacon_positions):
     is already present on that row.
 
     Parameters:
-    - sensor_positions: List of tuples representing sensor positions.
-    - beacon_positions: List of tuples representing beacon positions.
+    - parsed: Tuple of the sensor positions and beacon positions lists returned by parse.
 
     Returns:
-    - None: Prints the result directly.
+    - int: The number of positions on row_to_check where a beacon cannot exist.
     """
+    sensor_positions, beacon_positions = parsed
     covered_positions = set()  # To store all x positions that are covered on the row
 
     # Iterate through each sensor and its closest beacon
@@ -104,7 +86,7 @@ def part_1(sensor_positions, beacon_positions):
             covered_positions.remove(beacon_x)
 
     # The result is the number of positions where a beacon cannot exist
-    print(f"Part 1: Number of positions where a beacon cannot exist on row {row_to_check}: {len(covered_positions)}")
+    return len(covered_positions)
 
 
 def get_perimeter(sensor, distance):
@@ -134,7 +116,7 @@ def get_perimeter(sensor, distance):
         yield (x - dx, y - dy)
 
 
-def part_2(sensor_positions, beacon_positions):
+def part2(parsed):
     """
     Part 2: Find the position of the distress beacon and calculate its tuning frequency.
 
@@ -143,12 +125,12 @@ def part_2(sensor_positions, beacon_positions):
     the tuning frequency based on the beacon's coordinates.
 
     Parameters:
-    - sensor_positions: List of tuples representing sensor positions.
-    - beacon_positions: List of tuples representing beacon positions.
+    - parsed: Tuple of the sensor positions and beacon positions lists returned by parse.
 
     Returns:
-    - None: Prints the result directly.
+    - int: The tuning frequency of the distress beacon, or None if it is not found.
     """
+    sensor_positions, beacon_positions = parsed
     # Precompute the coverage distance for each sensor
     sensor_coverage = []
     for sensor, beacon in zip(sensor_positions, beacon_positions):
@@ -176,12 +158,10 @@ def part_2(sensor_positions, beacon_positions):
 
             # If the point is not covered by any sensor, it's the distress beacon
             if not is_covered:
-                tuning_frequency = x * 4_000_000 + y  # Calculate tuning frequency
-                print(f"Part 2: Distress beacon found at x={x}, y={y} with tuning frequency {tuning_frequency}")
-                return  # Exit after finding the beacon
+                return x * 4_000_000 + y  # Calculate tuning frequency
 
     # If no beacon is found within the grid limits
-    print("Part 2: Distress beacon not found within the grid limits.")
+    return None
 
 
 def main():
@@ -194,13 +174,17 @@ def main():
     - None
     """
     # Parse the input file to get sensor and beacon positions
-    sensor_positions, beacon_positions = parse_input(file_path)
+    parsed = parse(loader.load('input.txt'))
 
     # Execute Part 1
-    part_1(sensor_positions, beacon_positions)
+    print(f"Part 1: Number of positions where a beacon cannot exist on row {row_to_check}: {part1(parsed)}")
 
     # Execute Part 2
-    part_2(sensor_positions, beacon_positions)
+    tuning_frequency = part2(parsed)
+    if tuning_frequency is None:
+        print("Part 2: Distress beacon not found within the grid limits.")
+    else:
+        print(f"Part 2: Distress beacon tuning frequency {tuning_frequency}")
 
 
 # Entry point of the script
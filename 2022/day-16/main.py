@@ -1,19 +1,24 @@
 import re
-from collections import deque
-import sys
+from collections import namedtuple
 from functools import lru_cache
 
+from aoc import search
 
-def parse_input(file_path):
+
+# Everything both parts need: the raw valves, the useful ones, their bit positions and the BFS distances.
+Volcano = namedtuple('Volcano', ['valves', 'useful_valves', 'valve_indices', 'shortest_paths'])
+
+
+def parse_input(text):
     """
-    Parses the input file and returns a dictionary of valves.
+    Parses the puzzle input and returns a dictionary of valves.
 
     Each valve is represented as a key with a dictionary value containing:
     - 'flow_rate': Integer flow rate of the valve.
     - 'tunnels': List of connected valves.
 
     Parameters:
-    - file_path (str): The path to the input file.
+    - text (str): The contents of the input file.
 
     Returns:
     - dict: A dictionary representing all valves with their flow rates and connected tunnels.
@@ -24,34 +29,24 @@ def parse_input(file_path):
     pattern = re.compile(
         r"Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? (.+)"
     )
-    try:
-        # Open and read the input file line by line.
-        with open(file_path, 'r') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()  # Remove leading/trailing whitespace.
-                if not line:
-                    continue  # Skip empty lines.
-                match = pattern.match(line)
-                if match:
-                    valve, flow_rate, tunnels = match.groups()
-                    # Split the tunnels by comma and remove any extra whitespace.
-                    tunnels = [tunnel.strip() for tunnel in tunnels.split(",")]
-                    # Add the valve to the valves dictionary with its details.
-                    valves[valve] = {
-                        'flow_rate': int(flow_rate),
-                        'tunnels': tunnels
-                    }
-                else:
-                    # If a line doesn't match the expected pattern, print a warning.
-                    print(f"Line {line_num} didn't match pattern and was skipped: {line}")
-    except FileNotFoundError:
-        # Handle the case where the input file does not exist.
-        print(f"Error: The file '{file_path}' was not found.")
-        sys.exit(1)
-    except Exception as e:
-        # Handle any other exceptions that may occur during file reading/parsing.
-        print(f"An error occurred while reading the file: {e}")
-        sys.exit(1)
+    # Read the input line by line.
+    for line_num, line in enumerate(text.splitlines(), 1):
+        line = line.strip()  # Remove leading/trailing whitespace.
+        if not line:
+            continue  # Skip empty lines.
+        match = pattern.match(line)
+        if match:
+            valve, flow_rate, tunnels = match.groups()
+            # Split the tunnels by comma and remove any extra whitespace.
+            tunnels = [tunnel.strip() for tunnel in tunnels.split(",")]
+            # Add the valve to the valves dictionary with its details.
+            valves[valve] = {
+                'flow_rate': int(flow_rate),
+                'tunnels': tunnels
+            }
+        else:
+            # A line that doesn't match the expected pattern means the input is not a valve scan.
+            raise ValueError(f"Line {line_num} didn't match pattern: {line}")
 
     return valves
 
@@ -61,6 +56,7 @@ def bfs(start, graph):
     Performs Breadth-First Search (BFS) to find the shortest paths from the start valve to all other valves.
 
     Since each tunnel traversal takes 1 minute, BFS efficiently finds the minimum time required to reach each valve.
+    Valves are numbered in input order for the shared search (see aoc.search).
 
     Parameters:
     - start (str): The starting valve.
@@ -69,49 +65,34 @@ def bfs(start, graph):
     Returns:
     - dict: A dictionary mapping each reachable valve to its distance (in minutes) from the start valve.
     """
-    queue = deque([(start, 0)])  # Initialize the queue with the start valve and distance 0.
-    visited = {start: 0}          # Dictionary to keep track of visited valves and their distances.
-    while queue:
-        current, distance = queue.popleft()  # Dequeue the next valve and its distance.
-        for neighbor in graph[current]['tunnels']:
-            if neighbor not in visited:
-                visited[neighbor] = distance + 1  # Update distance for the neighbor.
-                queue.append((neighbor, distance + 1))  # Enqueue the neighbor for further exploration.
-    return visited
+    names = list(graph)
+    ids = {name: i for i, name in enumerate(names)}
+    tunnels = [[ids[tunnel] for tunnel in graph[name]['tunnels']] for name in names]
+    distances = search.bfs(len(names), ids[start], tunnels.__getitem__).distances
+    return {names[i]: distance for i, distance in enumerate(distances) if distance != search.UNREACHED}
 
 
-def main():
+def parse(text):
     """
-    The main function orchestrates the reading of input, processing of data, and computation of the maximum pressure release.
-    It handles both Part One and Part Two of the challenge.
+    Parses the input and precomputes everything both parts share.
 
     Steps:
-    1. Parse the input file to extract valve information.
+    1. Parse the input to extract valve information.
     2. Identify useful valves (those with a positive flow rate).
     3. Assign each useful valve a unique bit position.
     4. Precompute shortest paths between all relevant valves using BFS.
-    5. Use DFS with memoization to find the optimal sequence of valve openings for Part One.
-    6. Collect maximum pressures for all subsets of valves for Part Two.
-    7. Combine the results of two actors (you and the elephant) to find the maximum total pressure for Part Two.
-    8. Output the results for both parts.
-    """
-
-    input_file = 'input.txt'  # Specify the input file path.
 
-    # Step 1: Parse the input file to obtain the valves dictionary.
-    valves = parse_input(input_file)
+    Returns:
+    - Volcano: The valves, useful valves, their bit positions and the shortest paths between them.
+    """
+    # Step 1: Parse the input to obtain the valves dictionary.
+    valves = parse_input(text)
 
     # Step 2: Identify useful valves (valves with a flow rate greater than 0).
     useful_valves = {valve: details for valve, details in valves.items() if details['flow_rate'] > 0}
-    if not useful_valves:
-        # If no useful valves are found, there's nothing to do.
-        print("No useful valves found (all have flow rate=0). Nothing to do.")
-        return
 
     # Step 3: Assign each useful valve a unique bit position.
     valve_indices = {valve: idx for idx, valve in enumerate(useful_valves)}
-    # For debugging purposes, you can print the valve indices.
-    # print("Valve Indices:", valve_indices)
 
     # Step 4: Precompute shortest paths between all relevant valves.
     # Relevant valves include all useful valves plus the starting valve 'AA'.
@@ -121,17 +102,20 @@ def main():
         if valve in valves:
             # Compute the shortest paths from the current valve to all other valves.
             shortest_paths[valve] = bfs(valve, valves)
-        else:
-            # Warn if a relevant valve is not found in the valves dictionary.
-            print(f"Warning: Valve '{valve}' not found in the valves dictionary.")
 
     # Ensure that 'AA' is present in the shortest paths.
     if 'AA' not in shortest_paths:
-        print("Error: Starting valve 'AA' not found in the shortest paths.")
-        sys.exit(1)
+        raise ValueError("Starting valve 'AA' not found in the valves dictionary.")
 
-    # Step 5: Use DFS with memoization to find the optimal sequence of valve openings for Part One.
-    # We'll use bitmasking to represent opened valves.
+    return Volcano(valves, useful_valves, valve_indices, shortest_paths)
+
+
+def part1(volcano):
+    """
+    Uses DFS with memoization to find the optimal sequence of valve openings within 30 minutes.
+    We'll use bitmasking to represent opened valves.
+    """
+    useful_valves, valve_indices, shortest_paths = volcano.useful_valves, volcano.valve_indices, volcano.shortest_paths
 
     @lru_cache(maxsize=None)
     def dfs(current_valve, time_elapsed, opened_bitmask):
@@ -171,12 +155,18 @@ def main():
 
         return max_pressure
 
-    # Calculate Part One
-    part_one_result = dfs('AA', 0, 0)
-    print(f"Part One: {part_one_result}")
+    return dfs('AA', 0, 0)
+
+
+def part2(volcano):
+    """
+    Computes the maximum pressure achievable by two actors (you and the elephant) without overlapping valves.
 
-    # Step 6: For Part Two, compute the maximum pressure achievable by two actors without overlapping valves.
-    # We'll iterate through all possible subsets, calculate their pressures, and find the best pair of disjoint subsets.
+    Steps:
+    1. Collect maximum pressures for all subsets of valves opened within 26 minutes.
+    2. Combine the results of two actors to find the maximum total pressure.
+    """
+    useful_valves, valve_indices, shortest_paths = volcano.useful_valves, volcano.valve_indices, volcano.shortest_paths
 
     # Initialize a dictionary to store maximum pressure for each subset.
     max_pressures = {}
@@ -214,10 +204,10 @@ def main():
                     # Recursively explore further openings.
                     dfs_part2(valve, new_time, opened_bitmask | bit, pressure + new_pressure)
 
-    # Start DFS for Part Two.
+    # Step 1: Start DFS for Part Two.
     dfs_part2('AA', 0, 0, 0)
 
-    # Step 7: Combine the results of two actors to find the maximum total pressure.
+    # Step 2: Combine the results of two actors to find the maximum total pressure.
     max_total_pressure_part2 = 0
     all_bitmasks = list(max_pressures.keys())
 
@@ -230,8 +220,18 @@ def main():
                 if total_pressure > max_total_pressure_part2:
                     max_total_pressure_part2 = total_pressure
 
-    # Output the result for Part Two.
-    print(f"Part Two: {max_total_pressure_part2}")
+    return max_total_pressure_part2
+
+
+def main():
+    """
+    The main function reads the input and outputs the maximum pressure release for both Part One and Part Two.
+    """
+    with open('input.txt', 'r') as file:  # Specify the input file path.
+        volcano = parse(file.read())
+
+    print(f"Part One: {part1(volcano)}")
+    print(f"Part Two: {part2(volcano)}")
 
 
 # Entry point of the script.
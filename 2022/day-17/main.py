@@ -1,3 +1,15 @@
+from aoc import cycles
+
+# Coordinate tuples for falling rock shapes
+horizontal_line = [(0, 0), (1, 0), (2, 0), (3, 0)]
+plus_sign = [(1, 0), (0, 1), (1, 1), (2, 1), (1, 2)]
+reverse_l = [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)]
+vertical_line = [(0, 0), (0, 1), (0, 2), (0, 3)]
+square = [(0, 0), (1, 0), (0, 1), (1, 1)]
+
+ROCK_SHAPES = [horizontal_line, plus_sign, reverse_l, vertical_line, square]
+
+
 class Rock:
     def __init__(self, shape, initial_position):
         """
@@ -88,7 +100,9 @@ class Chamber:
         self.occupied = set()  # Set of (x, y) tuples
         self.jet_sequence = jet_sequence
         self.jet_index = 0
+        self.shape_index = 0
         self.highest_y = -1  # Start from floor at y = -1
+        self.column_tops = [-1] * self.width  # Highest rock in each column
 
     def get_next_jet(self):
         """
@@ -147,6 +161,8 @@ class Chamber:
         """
         for pos in rock.get_absolute_positions():
             self.occupied.add(pos)
+            if pos[1] > self.column_tops[pos[0]]:
+                self.column_tops[pos[0]] = pos[1]
             if pos[1] > self.highest_y:
                 self.highest_y = pos[1]
 
@@ -175,28 +191,48 @@ class Chamber:
             return False
         return True
 
-    def get_chamber_profile(self, depth=30):
+    def get_chamber_profile(self):
         """
-        Captures the top 'depth' rows of the chamber to create a profile.
-
-        Parameters:
-        - depth: Number of top rows to include in the profile.
+        Captures the shape of the top of the tower.
 
         Returns:
-        - Tuple representing the relative heights of each column.
+        - Tuple of how far each column's highest rock is below the top of the tower.
+        """
+        return tuple(self.highest_y - max_y for max_y in self.column_tops)
+
+    def get_state_key(self, shape_count):
+        """
+        Fingerprints the chamber: the next rock shape, the position in the jet pattern and the
+        top profile. Two chambers with the same key grow the same way from here on.
         """
-        profile = []
-        for x in range(self.width):
-            # Find the highest rock in this column
-            column_heights = [y for (col_x, y) in self.occupied if col_x == x]
-            if column_heights:
-                max_y = max(column_heights)
-            else:
-                max_y = -1  # No rocks in this column
-            # Calculate the relative height from the top
-            relative_height = self.highest_y - max_y
-            profile.append(relative_height)
-        return tuple(profile)
+        return (
+            self.shape_index % shape_count,
+            self.jet_index % len(self.jet_sequence),
+            self.get_chamber_profile()
+        )
+
+    def drop_rock(self, rock_shapes):
+        """
+        Drops the next rock in the sequence until it comes to rest.
+
+        Parameters:
+        - rock_shapes: List of rock shapes (list of (x, y) tuples).
+        """
+        # Spawn a new rock based on the current shape in sequence
+        shape = rock_shapes[self.shape_index % len(rock_shapes)]
+        rock = self.spawn_rock(shape)
+        self.shape_index += 1
+
+        # Continue moving the rock until it comes to rest
+        while True:
+            # Apply jet push
+            jet_direction = self.get_next_jet()
+            self.move_rock(rock, jet_direction)
+
+            # Attempt to move down (gravity); when it cannot, the rock comes to rest
+            if not self.move_rock(rock, 'down'):
+                self.update_occupied(rock)
+                return
 
     def simulate_fall(self, rock_shapes, total_rocks):
         """
@@ -208,65 +244,18 @@ class Chamber:
 
         Returns:
         - Final tower height after simulation.
+
+        Rocks are dropped one at a time until the chamber's state key repeats (see aoc.cycles);
+        the height is then extrapolated over the remaining whole cycles.
         """
-        rock_count = 0
-        shape_index = 0
-
-        # Dictionary to store seen states
-        # Key: (shape_index % len(rock_shapes), jet_index % len(jet_sequence), chamber_profile)
-        # Value: (rock_count, highest_y)
-        seen_states = {}
-        additional_height = 0  # Height gained from cycles
-
-        while rock_count < total_rocks:
-            # Spawn a new rock based on the current shape in sequence
-            shape = rock_shapes[shape_index % len(rock_shapes)]
-            rock = self.spawn_rock(shape)
-            shape_index += 1
-
-            # Continue moving the rock until it comes to rest
-            while True:
-                # Apply jet push
-                jet_direction = self.get_next_jet()
-                self.move_rock(rock, jet_direction)
-
-                # Attempt to move down (gravity)
-                moved_down = self.move_rock(rock, 'down')
-
-                if not moved_down:
-                    # Rock comes to rest; update occupied positions
-                    self.update_occupied(rock)
-                    rock_count += 1
-                    break
-
-            # After the rock has settled, capture the current state
-            state_key = (
-                shape_index % len(rock_shapes),
-                self.jet_index % len(self.jet_sequence),
-                self.get_chamber_profile()
-            )
-
-            if state_key in seen_states and rock_count < total_rocks:
-                # Cycle detected
-                previous_rock_count, previous_height = seen_states[state_key]
-                cycle_length = rock_count - previous_rock_count
-                cycle_height = self.highest_y - previous_height
-
-                # Calculate how many cycles can fit into the remaining rocks
-                remaining_rocks = total_rocks - rock_count
-                cycles = remaining_rocks // cycle_length
-
-                if cycles > 0:
-                    # Apply the cycle height and increment the rock count accordingly
-                    additional_height += cycles * cycle_height
-                    rock_count += cycles * cycle_length
-            else:
-                # Store the state
-                seen_states[state_key] = (rock_count, self.highest_y)
-
-        # Total height is the current highest_y plus any additional height from cycles
-        total_height = self.highest_y + 1 + additional_height  # +1 to account for zero indexing
-        return total_height  # Return the final tower height
+        height, _ = cycles.run(
+            self,
+            lambda chamber: chamber.drop_rock(rock_shapes),
+            total_rocks,
+            key=lambda chamber: chamber.get_state_key(len(rock_shapes)),
+            measure=lambda chamber: chamber.highest_y + 1,  # +1 to account for zero indexing
+        )
+        return height  # Return the final tower height
 
     def visualize(self, current_rock=None):
         """
@@ -300,54 +289,39 @@ class Chamber:
         print('+' + '-' * self.width + '+')
 
 
-def main():
-    # Open the input file once
-    with open('input.txt', 'r') as file:
-        jet_sequence = list(file.read().strip())
+def parse(text):
+    return list(text.strip())
 
-    # Print the jet sequence (Optional: Comment out if not needed)
-    # print("Jet Sequence:", ''.join(jet_sequence))
 
-    # Coordinate tuples for falling rock shapes
-    horizontal_line = [(0, 0), (1, 0), (2, 0), (3, 0)]
-    plus_sign = [(1, 0), (0, 1), (1, 1), (2, 1), (1, 2)]
-    reverse_l = [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)]
-    vertical_line = [(0, 0), (0, 1), (0, 2), (0, 3)]
-    square = [(0, 0), (1, 0), (0, 1), (1, 1)]
+def part1(jet_sequence):
+    # Simulate 2022 rocks in a fresh chamber
+    chamber = Chamber(jet_sequence)
+    return chamber.simulate_fall(ROCK_SHAPES, 2022)
 
-    rock_shapes = [horizontal_line, plus_sign, reverse_l, vertical_line, square]
+
+def part2(jet_sequence):
+    # Simulate 1000000000000 rocks in a fresh chamber
+    chamber = Chamber(jet_sequence)
+    return chamber.simulate_fall(ROCK_SHAPES, 1000000000000)
+
+
+def main():
+    # Open the input file once
+    with open('input.txt', 'r') as file:
+        jet_sequence = parse(file.read())
 
     # Optional: Visualize each rock shape individually for debugging (Comment out if not needed)
     # print("\nIndividual Rock Shapes:")
-    # for idx, shape in enumerate(rock_shapes, start=1):
+    # for idx, shape in enumerate(ROCK_SHAPES, start=1):
     #     print(f"\nRock {idx}:")
     #     rock = Rock(shape, (0, 0))
     #     rock.visualize_shape()
 
-    # Initialize the chamber
-    chamber = Chamber(jet_sequence)
-
-    # -----------------------------
-    # Part 1: Simulate 2022 Rocks
-    # -----------------------------
-    total_rocks_to_simulate_part1 = 2022
-    part1_height = chamber.simulate_fall(rock_shapes, total_rocks_to_simulate_part1)
-
     # Print final tower height for Part 1
-    print(f"part1: {part1_height}")
-
-    # -----------------------------
-    # Part 2: Simulate 1000000000000 Rocks
-    # -----------------------------
-    total_rocks_to_simulate_part2 = 1000000000000
-
-    # Reset chamber for Part 2
-    chamber = Chamber(jet_sequence)
-
-    part2_height = chamber.simulate_fall(rock_shapes, total_rocks_to_simulate_part2)
+    print(f"part1: {part1(jet_sequence)}")
 
     # Print final tower height for Part 2
-    print(f"part2: {part2_height}")
+    print(f"part2: {part2(jet_sequence)}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,4 @@
-import sys
-from collections import deque
+from aoc import loader, search
 
 # Define the six possible neighbor directions (±x, ±y, ±z)
 NEIGHBORS = [(-1, 0, 0), (1, 0, 0),
@@ -7,25 +6,22 @@ NEIGHBORS = [(-1, 0, 0), (1, 0, 0),
              (0, 0, -1), (0, 0, 1)]
 
 
-def read_input(file_path):
+@loader.takes_bytes
+def parse(data):
     """
-    Reads the input file and returns a set of cube positions.
+    Reads the puzzle input and returns a set of cube positions.
 
     Parameters:
-    - file_path (str): Path to the input file.
+    - data: The input file's bytes (see aoc.loader), or its text.
 
     Returns:
     - Set of tuples representing the positions of cubes.
     """
     cubes = set()
-    with open(file_path, 'r') as file:
-        for line in file:
-            # Remove any leading/trailing whitespace and split by comma
-            parts = line.strip().split(',')
-            if len(parts) != 3:
-                continue  # Skip invalid lines
-            x, y, z = map(int, parts)
-            cubes.add((x, y, z))
+    for parts in loader.ints_per_line(data):
+        if len(parts) != 3:
+            continue  # Skip invalid lines
+        cubes.add(parts)
     return cubes
 
 
@@ -54,66 +50,72 @@ def calculate_external_surface_area(cubes):
     """
     Calculates the external surface area of the lava droplet, excluding internal cavities.
 
+    The air around the droplet is flood-filled with the shared BFS (see aoc.search) over a flat
+    box one cell bigger than the droplet on every side, itself wrapped in a layer of blocked cells
+    so that neighbours are plain index offsets with no bounds checks.
+
     Parameters:
     - cubes (set): Set of tuples representing the positions of cubes.
 
     Returns:
     - int: External surface area.
     """
-    # Determine bounding box
-    min_x = min(x for x, _, _ in cubes) - 1
-    max_x = max(x for x, _, _ in cubes) + 1
-    min_y = min(y for _, y, _ in cubes) - 1
-    max_y = max(y for _, y, _ in cubes) + 1
-    min_z = min(z for _, _, z in cubes) - 1
-    max_z = max(z for _, _, z in cubes) + 1
-
-    # Initialize visited set and queue for BFS
-    visited = set()
-    queue = deque()
-    start = (min_x, min_y, min_z)
-    queue.append(start)
-    visited.add(start)
-
-    while queue:
-        x, y, z = queue.popleft()
-        for dx, dy, dz in NEIGHBORS:
-            nx, ny, nz = x + dx, y + dy, z + dz
-            neighbor = (nx, ny, nz)
-            # Check if neighbor is within bounds and not a cube and not visited
-            if (min_x <= nx <= max_x and
-                min_y <= ny <= max_y and
-                min_z <= nz <= max_z and
-                neighbor not in cubes and
-                    neighbor not in visited):
-                visited.add(neighbor)
-                queue.append(neighbor)
+    # Determine bounding box: one layer of air around the droplet plus the blocked shell
+    min_x = min(x for x, _, _ in cubes) - 2
+    min_y = min(y for _, y, _ in cubes) - 2
+    min_z = min(z for _, _, z in cubes) - 2
+    size_x = max(x for x, _, _ in cubes) + 3 - min_x
+    size_y = max(y for _, y, _ in cubes) + 3 - min_y
+    size_z = max(z for _, _, z in cubes) + 3 - min_z
+
+    def index(x, y, z):
+        return ((x - min_x) * size_y + (y - min_y)) * size_z + (z - min_z)
+
+    offsets = [dx * size_y * size_z + dy * size_z + dz for dx, dy, dz in NEIGHBORS]
+
+    # Mark the shell and the cubes as blocked
+    blocked = bytearray(size_x * size_y * size_z)
+    for i in range(len(blocked)):
+        x, rest = divmod(i, size_y * size_z)
+        y, z = divmod(rest, size_z)
+        if x in (0, size_x - 1) or y in (0, size_y - 1) or z in (0, size_z - 1):
+            blocked[i] = 1
+    cube_indices = [index(*cube) for cube in cubes]
+    for i in cube_indices:
+        blocked[i] = 1
+
+    def open_neighbours(i):
+        return [i + offset for offset in offsets if not blocked[i + offset]]
+
+    # Flood the external air from a corner of the box
+    start = index(min_x + 1, min_y + 1, min_z + 1)
+    outside = search.bfs(len(blocked), start, open_neighbours).distances
 
     # Now, calculate surface area by only counting sides adjacent to external air
     external_surface_area = 0
-    for cube in cubes:
-        x, y, z = cube
-        for dx, dy, dz in NEIGHBORS:
-            neighbor = (x + dx, y + dy, z + dz)
-            if neighbor not in cubes and neighbor in visited:
+    for i in cube_indices:
+        for offset in offsets:
+            if outside[i + offset] != search.UNREACHED:
                 external_surface_area += 1  # External exposed side
     return external_surface_area
 
 
-def main():
+def part1(cubes):
+    # Calculate total surface area
+    return calculate_total_surface_area(cubes)
 
-    input_file = 'input.txt'
 
-    # Read and parse the input
-    cubes = read_input(input_file)
+def part2(cubes):
+    # Calculate external surface area (excluding internal cavities)
+    return calculate_external_surface_area(cubes)
+
 
-    # Part 1: Calculate total surface area
-    part1_surface_area = calculate_total_surface_area(cubes)
-    print(f"part1: {part1_surface_area}")
+def main():
+    # Read and parse the input
+    cubes = parse(loader.load('input.txt'))
 
-    # Part 2: Calculate external surface area (excluding internal cavities)
-    part2_surface_area = calculate_external_surface_area(cubes)
-    print(f"part2: {part2_surface_area}")
+    print(f"part1: {part1(cubes)}")
+    print(f"part2: {part2(cubes)}")
 
 
 if __name__ == "__main__":
@@ -3,9 +3,9 @@ from functools import lru_cache
 import re
 
 
-def parse_input(file_path):
+def parse(text):
     """
-    Parses the input file and returns a dictionary of blueprints.
+    Parses the puzzle input and returns a dictionary of blueprints.
 
     Blueprint 1: Each ore robot costs 4 ore. Each clay robot costs 2 ore. Each obsidian robot costs 3 ore and 14 clay. Each geode robot costs 2 ore and 7 obsidian.
     """
@@ -15,30 +15,26 @@ def parse_input(file_path):
     pattern = re.compile(
         r"Blueprint (\d+): Each ore robot costs (\d+) ore. Each clay robot costs (\d+) ore. Each obsidian robot costs (\d+) ore and (\d+) clay. Each geode robot costs (\d+) ore and (\d+) obsidian."
     )
-    try:
-        # Open and read the input file line by line.
-        with open(file_path, 'r') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()  # Remove leading/trailing whitespace.
-                if not line:
-                    continue  # Skip empty lines.
-                match = pattern.match(line)
-                if match:
-                    blueprint_num, ore_cost, clay_cost, obsidian_cost, obsidian_clay_cost, geode_cost, geode_obsidian_cost = match.groups()
-                    # Add the blueprint to the blueprints dictionary with its details.
-                    blueprints[int(blueprint_num)] = {
-                        'ore_cost': int(ore_cost),
-                        'clay_cost': int(clay_cost),
-                        'obsidian_cost': int(obsidian_cost),
-                        'obsidian_clay_cost': int(obsidian_clay_cost),
-                        'geode_cost': int(geode_cost),
-                        'geode_obsidian_cost': int(geode_obsidian_cost)
-                    }
-                else:
-                    # If a line doesn't match the expected pattern, print a warning.
-                    print(f"Line {line_num} didn't match pattern and was skipped: {line}")
-    except FileNotFoundError:
-        print(f"File not found: {file_path}")
+    # Read the input line by line.
+    for line_num, line in enumerate(text.splitlines(), 1):
+        line = line.strip()  # Remove leading/trailing whitespace.
+        if not line:
+            continue  # Skip empty lines.
+        match = pattern.match(line)
+        if match:
+            blueprint_num, ore_cost, clay_cost, obsidian_cost, obsidian_clay_cost, geode_cost, geode_obsidian_cost = match.groups()
+            # Add the blueprint to the blueprints dictionary with its details.
+            blueprints[int(blueprint_num)] = {
+                'ore_cost': int(ore_cost),
+                'clay_cost': int(clay_cost),
+                'obsidian_cost': int(obsidian_cost),
+                'obsidian_clay_cost': int(obsidian_clay_cost),
+                'geode_cost': int(geode_cost),
+                'geode_obsidian_cost': int(geode_obsidian_cost)
+            }
+        else:
+            # If a line doesn't match the expected pattern, it is not a blueprint.
+            raise ValueError(f"Line {line_num} didn't match pattern: {line}")
 
     return blueprints
 
@@ -145,34 +141,39 @@ def maximize_geodes(blueprint, time_limit=24):
     return max_geodes
 
 
-def main():
-    blueprints = parse_input("input.txt")
-
-    # Part 1: Calculate total quality level for all blueprints with a 24-minute limit
+def part1(blueprints):
+    # Calculate total quality level for all blueprints with a 24-minute limit
     time_limit_part1 = 24
     total_quality_level = 0
 
     for bp_id, blueprint in blueprints.items():
         max_geodes = maximize_geodes(blueprint, time_limit_part1)
         quality_level = bp_id * max_geodes
-        print(f"Blueprint {bp_id} (24 min): Geodes = {max_geodes}, Quality Level = {quality_level}")
         total_quality_level += quality_level
 
-    print(f"Part 1: Total Quality Level = {total_quality_level}")
+    return total_quality_level
 
-    # Part 2: Only consider the first three blueprints with a 32-minute limit
+
+def part2(blueprints):
+    # Only consider the first three blueprints with a 32-minute limit
     max_geodes_results = []
     time_limit_part2 = 32
 
     for bp_id in range(1, 4):  # Only the first three blueprints
         blueprint = blueprints[bp_id]
         max_geodes = maximize_geodes(blueprint, time_limit_part2)
-        print(f"Blueprint {bp_id} (32 min): Max Geodes = {max_geodes}")
         max_geodes_results.append(max_geodes)
 
-    # Multiply the maximum geodes from the first three blueprints for Part 2
-    part2_result = max_geodes_results[0] * max_geodes_results[1] * max_geodes_results[2]
-    print(f"Part 2: Product of Geodes (First 3 Blueprints) = {part2_result}")
+    # Multiply the maximum geodes from the first three blueprints
+    return max_geodes_results[0] * max_geodes_results[1] * max_geodes_results[2]
+
+
+def main():
+    with open("input.txt", 'r') as file:
+        blueprints = parse(file.read())
+
+    print(f"Part 1: Total Quality Level = {part1(blueprints)}")
+    print(f"Part 2: Product of Geodes (First 3 Blueprints) = {part2(blueprints)}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
-def read_input(file_path: str) -> list:
-    """Reads the input file and returns a list of integers."""
-    with open(file_path, "r") as file:
-        return [int(line) for line in file.read().splitlines()]
+from aoc import loader
+
+
+@loader.takes_bytes
+def parse(data) -> list:
+    """Reads the puzzle input and returns its integers (an array, which behaves like a list here)."""
+    return loader.ints(data)
 
 
 def mix(data: list, times: int = 1) -> list:
@@ -28,19 +31,24 @@ def find_grove_coordinates(data: list) -> list:
     return [data[(zero_index + i) % length] for i in [1000, 2000, 3000]]
 
 
-def main():
-    # Part 1
-    original_data = read_input('input.txt')
+def part1(original_data: list) -> int:
+    """Mixes the numbers once and sums the grove coordinates."""
     mixed_data = mix(original_data)
-    grove_coordinates = find_grove_coordinates(mixed_data)
-    print("Part 1 solution:", sum(grove_coordinates))
+    return sum(find_grove_coordinates(mixed_data))
+
 
-    # Part 2
+def part2(original_data: list) -> int:
+    """Applies the decryption key, mixes ten times and sums the grove coordinates."""
     decryption_key = 811589153
     scaled_data = [x * decryption_key for x in original_data]
     mixed_data = mix(scaled_data, times=10)
-    grove_coordinates = find_grove_coordinates(mixed_data)
-    print("Part 2 solution:", sum(grove_coordinates))
+    return sum(find_grove_coordinates(mixed_data))
+
+
+def main():
+    original_data = parse(loader.load('input.txt'))
+    print("Part 1 solution:", part1(original_data))
+    print("Part 2 solution:", part2(original_data))
 
 
 if __name__ == "__main__":
@@ -1,21 +1,22 @@
 import copy
 
 
-def parse_input(file_path: str):
+def parse(text: str):
     """
-    Parses the input file and returns a dictionary of monkey jobs.
+    Parses the puzzle input and returns a dictionary of monkey jobs.
     """
     monkeys = {}
-    with open(file_path, "r") as file:
-        for line in file:
-            line = line.strip()
-            monkey, jobs = line.split(":")
-            jobs = jobs.split(" ")
-            jobs = [job for job in jobs if job != '']  # Remove empty strings
-            if len(jobs) == 1:
-                monkeys[monkey] = {'number': int(jobs[0])}
-            else:
-                monkeys[monkey] = {'neighbours': [jobs[0], jobs[2]], 'operator': jobs[1]}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        monkey, jobs = line.split(":")
+        jobs = jobs.split(" ")
+        jobs = [job for job in jobs if job != '']  # Remove empty strings
+        if len(jobs) == 1:
+            monkeys[monkey] = {'number': int(jobs[0])}
+        else:
+            monkeys[monkey] = {'neighbours': [jobs[0], jobs[2]], 'operator': jobs[1]}
     return monkeys
 
 
@@ -115,22 +116,26 @@ def run_monkey_jobs(monkeys: dict, part_two=False):
     return resolve_monkey('root', monkeys)
 
 
+def part1(monkeys: dict):
+    # resolve_monkey caches numbers on the monkeys, so work on a deep copy
+    return run_monkey_jobs(copy.deepcopy(monkeys))
+
+
+def part2(monkeys: dict):
+    return run_monkey_jobs(copy.deepcopy(monkeys), part_two=True)
+
+
 def main():
     # Load the input data once
-    monkeys = parse_input('input.txt')
-
-    # Create a deep copy for each part
-    monkeys_part1 = copy.deepcopy(monkeys)
-    monkeys_part2 = copy.deepcopy(monkeys)
+    with open('input.txt', "r") as file:
+        monkeys = parse(file.read())
 
     # Solve Part 1
-    part1_result = run_monkey_jobs(monkeys_part1)
-    print("Part 1 - Resolved monkey jobs:", part1_result)
+    print("Part 1 - Resolved monkey jobs:", part1(monkeys))
 
     # Solve Part 2
-    part2_result = run_monkey_jobs(monkeys_part2, part_two=True)
-    print("Part 2 - Value for 'humn' that satisfies root's equality:", part2_result)
+    print("Part 2 - Value for 'humn' that satisfies root's equality:", part2(monkeys))
 
 
-# Run the main function to get results for both parts
-main()
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 import re
 
+from aoc.grid import Grid
+
+VOID, OPEN, WALL = b" .#"
+
 
 class CodeMap:
-    def parse_input(self, data):
-        with open(data) as f:
-            data = f.read().split("\n\n")
+    def parse_input(self, text):
+        data = text.split("\n\n")
         board_map = data[0].split("\n")
         path_map = data[1].strip()
         return board_map, path_map
@@ -13,13 +16,12 @@ class CodeMap:
         return re.findall(r'\d+|[RL]', path_map)
 
     def define_grid(self, board_map):
-        height = len(board_map)
-        width = max(len(row) for row in board_map)
-        grid = [list(row.ljust(width)) for row in board_map]
-        return grid, height, width
+        # Short rows are padded with void on the right
+        grid = Grid.from_rows(board_map)
+        return grid, grid.height, grid.width
 
     def find_start_position(self, grid):
-        return 0, next(i for i, tile in enumerate(grid[0]) if tile == '.')
+        return 0, grid.cells.index(OPEN, 0, grid.width)
 
     def move(self, grid, row, col, facing, count):
         moves = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # right, down, left, up
@@ -28,19 +30,19 @@ class CodeMap:
         for _ in range(count):
             new_row, new_col = row + dr, col + dc
 
-            if not (0 <= new_row < len(grid) and 0 <= new_col < len(grid[0])) or grid[new_row][new_col] == ' ':
+            if not grid.in_bounds(new_row, new_col) or grid.get(new_row, new_col) == VOID:
                 # Wrap around
                 wrap_row, wrap_col = row, col
-                while 0 <= wrap_row < len(grid) and 0 <= wrap_col < len(grid[0]) and grid[wrap_row][wrap_col] != ' ':
+                while grid.in_bounds(wrap_row, wrap_col) and grid.get(wrap_row, wrap_col) != VOID:
                     wrap_row -= dr
                     wrap_col -= dc
                 wrap_row += dr
                 wrap_col += dc
 
-                if grid[wrap_row][wrap_col] == '#':
+                if grid.get(wrap_row, wrap_col) == WALL:
                     break
                 row, col = wrap_row, wrap_col
-            elif grid[new_row][new_col] == '#':
+            elif grid.get(new_row, new_col) == WALL:
                 break
             else:
                 row, col = new_row, new_col
@@ -66,15 +68,101 @@ class CodeMap:
         return 1000 * (row + 1) + 4 * (col + 1) + facing
 
 
-def main():
+# Part 2 cube wrapping taken wholesale from https://coeleveld.com/2022-advent-of-code-python/
+
+
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+
+
+def add_tuple(a, b):
+    return tuple(x + y for x, y in zip(a, b))
+
+
+def move2(grid, d, i, j):
+    nd, ni, nj = d, *add_tuple((i, j), DIRECTIONS[d])
+
+    match nd, ni, nj:
+        case 0, _, 150 if ni in range(50):
+            nd, ni, nj = 2, 149 - ni, 99
+        case 0, _, 100 if ni in range(50, 100):
+            nd, ni, nj = 3, 49, 50 + ni
+        case 0, _, 100 if ni in range(100, 150):
+            nd, ni, nj = 2, 149 - ni, 149
+        case 0, _, 50 if ni in range(150, 200):
+            nd, ni, nj = 3, 149, ni - 100
+
+        case 1, 200, _ if nj in range(50):
+            nd, ni, nj = 1, 0, nj + 100
+        case 1, 150, _ if nj in range(50, 100):
+            nd, ni, nj = 2, nj + 100, 49
+        case 1, 50, _ if nj in range(100, 150):
+            nd, ni, nj = 2, nj - 50, 99
+
+        case 2, _, 49 if ni in range(0, 50):
+            nd, ni, nj = 0, 149 - ni, 0
+        case 2, _, 49 if ni in range(50, 100):
+            nd, ni, nj = 1, 100, ni - 50
+        case 2, _, -1 if ni in range(100, 150):
+            nd, ni, nj = 0, 149 - ni, 50
+        case 2, _, -1 if ni in range(150, 200):
+            nd, ni, nj = 1, 0, ni - 100
+
+        case 3, 99, _ if nj in range(50):
+            nd, ni, nj = 0, 50 + nj, 50
+        case 3, -1, _ if nj in range(50, 100):
+            nd, ni, nj = 0, nj + 100, 0
+        case 3, -1, _ if nj in range(100, 150):
+            nd, ni, nj = 3, 199, nj - 100
+
+    cell = grid.get(ni, nj)
+    if cell == OPEN:
+        return nd, ni, nj
+    elif cell == WALL:
+        return d, i, j
+
+
+def parse(text):
+    return CodeMap().parse_input(text)
+
+
+def part1(parsed):
+    board_map, path_map = parsed
     my_obj = CodeMap()
-    board_map, path_map = my_obj.parse_input('input.txt')
     grid, height, width = my_obj.define_grid(board_map)
 
     row, col, facing = my_obj.read_route(path_map, grid)
 
-    password = my_obj.calculate_password(row, col, facing)
-    print("Final Password:", password)
+    return my_obj.calculate_password(row, col, facing)
+
+
+def part2(parsed):
+    board_map, path_map = parsed
+    grid = Grid.from_rows(board_map)
+
+    instructions = re.split(r"(?<=\d)(?=[LR])|(?<=[LR])(?=\d)", path_map)
+    d, i, j = 0, 0, next(j for j in range(grid.width) if grid.get(0, j) != VOID)
+
+    for c in instructions:
+        match c:
+            case "L":
+                d -= 1
+                d %= 4
+            case "R":
+                d += 1
+                d %= 4
+            case _:
+                for _ in range(int(c)):
+                    d, i, j = move2(grid, d, i, j)
+
+    return (i + 1) * 1000 + (j + 1) * 4 + d
+
+
+def main():
+    with open('input.txt') as f:
+        parsed = parse(f.read())
+
+    print("Final Password:", part1(parsed))
+    print("Final Password on the cube:", part2(parsed))
 
 
 if __name__ == "__main__":
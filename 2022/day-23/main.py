@@ -1,24 +1,24 @@
+from aoc import loader
+
+
+@loader.takes_bytes
+def parse(data):
+    """ Parse the puzzle input and return a frozenset of (row, column) coordinates of the elves.
+    """
+    return frozenset(loader.grid(data).positions(b'#'))
+
+
 class ElfSimulation:
-    def __init__(self, file_path):
-        self.file_path = file_path
-        self.elf_coordinates = self.parse_input(file_path)
+    def __init__(self, elf_coordinates):
+        # Keep the starting positions so the simulation can be reset without re-reading the input
+        self.initial_coordinates = frozenset(elf_coordinates)
+        self.elf_coordinates = set(self.initial_coordinates)
         self.directions = ['N', 'S', 'W', 'E']
 
     def reset(self):
-        self.elf_coordinates = self.parse_input(self.file_path)
+        self.elf_coordinates = set(self.initial_coordinates)
         self.directions = ['N', 'S', 'W', 'E']
 
-    def parse_input(self, file_path):
-        """ Parse input file and return a set of coordinates of the elves.
-        """
-        elf_coordinates = set()  # Initialize as a set
-        with open(file_path, "r") as file:
-            for i, line in enumerate(file):
-                for j, char in enumerate(line.strip()):
-                    if char == '#':
-                        elf_coordinates.add((i, j))
-        return elf_coordinates
-
     def get_neighbors(self, x, y):
         """For each item in the set, check the neighbors."""
         return [
@@ -139,22 +139,31 @@ class ElfSimulation:
         return max_rounds  # Return max_rounds if we didn't stop early
 
 
-if __name__ == "__main__":
-    file_path = 'input.txt'
-    simulation = ElfSimulation(file_path)
+def part1(elf_coordinates):
+    # Run 10 rounds and count the empty ground tiles
+    simulation = ElfSimulation(elf_coordinates)
+    simulation.run_simulation(max_rounds=10, print_map=False)
+    return simulation.calculate_empty_tiles()
+
+
+def part2(elf_coordinates):
+    # Run up to 10000 rounds or until no moves occur, no map printing
+    simulation = ElfSimulation(elf_coordinates)
+    return simulation.run_simulation(max_rounds=10000, print_map=False)
 
-    # Part 1: Run 10 rounds and print the map
-    part1_rounds = simulation.run_simulation(max_rounds=10, print_map=False)
-    empty_tiles = simulation.calculate_empty_tiles()
-    print(f"Part 1: Empty ground tiles after {part1_rounds} rounds: {empty_tiles}")
 
-    # Reset the simulation for Part 2
-    simulation.reset()
+def main():
+    elf_coordinates = parse(loader.load('input.txt'))
 
-    # Part 2: Run up to 10000 rounds or until no moves occur, no map printing
-    part2_rounds = simulation.run_simulation(max_rounds=10000, print_map=False)
-    print(f"Part 2: First round with no moves: {part2_rounds}")
+    print(f"Part 1: Empty ground tiles after 10 rounds: {part1(elf_coordinates)}")
+    print(f"Part 2: First round with no moves: {part2(elf_coordinates)}")
 
     # Debug: Print final state
+    # simulation = ElfSimulation(elf_coordinates)
+    # simulation.run_simulation(max_rounds=10000)
     # print("Final state:")
     # simulation.print_map()
+
+
+if __name__ == "__main__":
+    main()
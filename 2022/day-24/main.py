@@ -1,70 +1,87 @@
-from collections import deque
+import math
+
+from aoc import search
+from aoc.grid import Grid
+
+WALL, OPEN, UP, DOWN, LEFT, RIGHT = b"#.^v<>"
 
 # Directions: up, down, left, right
 DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1), (0, 0)]  # Adding wait (0, 0)
 
 
 class Valley:
-    def __init__(self, file_name):
-        """ Initialize the Valley object by parsing the input file """
-        self.rows, self.cols, self.width, self.height, self.start, self.end = self.parse_input(file_name)
-
-    def parse_input(self, file_name):
-        """ Parse the input file to get the grid, blizzards, start, and exit points """
-        with open(file_name, 'r') as file:
-            rows = [list(line.strip()) for line in file]
+    def __init__(self, text):
+        """ Initialize the Valley object by parsing the puzzle input """
+        self.grid, self.width, self.height, self.start, self.end = self.parse_input(text)
 
-        width = len(rows[0])
-        height = len(rows)
-
-        # Columns for easy blizzard checking
-        cols = [[rows[y][x] for y in range(height)] for x in range(width)]
+    def parse_input(self, text):
+        """ Parse the puzzle input to get the grid, blizzards, start, and exit points """
+        # One flat byte grid serves both the row and the column blizzard checks
+        grid = Grid.from_text(text)
+        width = grid.width
+        height = grid.height
 
         # Start and end points (where '.' is in the first and last rows)
-        start = [(i, 0) for i, val in enumerate(rows[0]) if val == '.'][0]  # Find start
-        end = [(i, height - 1) for i, val in enumerate(rows[-1]) if val == '.'][0]  # Find end
+        start = (grid.cells.index(OPEN, 0, width), 0)  # Find start
+        end = (grid.cells.index(OPEN, grid.index(height - 1, 0)) % width, height - 1)  # Find end
 
-        return rows, cols, width, height, start, end
+        return grid, width, height, start, end
 
     def wrapped(self, n, maxn):
         """ Wrap the position for blizzard movement """
         return (n - 1) % (maxn - 2) + 1
 
     def bfs(self, start, goal, start_time):
-        """ Perform the BFS-like search to find the shortest time from start to goal """
-        current = [start]
-        time = start_time
-
-        while True:
-            next_positions = []
-            for pos in current:
-                for dx, dy in DIRECTIONS:
-                    x, y = pos[0] + dx, pos[1] + dy
-
-                    # Filter positions that are out of bounds or hit walls
-                    if y < 0 or y >= self.height or self.cols[x][y] == '#':
-                        continue
-
-                    # Check horizontal blizzards '<' and '>'
-                    if self.rows[y][self.wrapped(x + time, self.width)] == '<' or \
-                       self.rows[y][self.wrapped(x - time, self.width)] == '>':
-                        continue
-
-                    # Check vertical blizzards '^' and 'v'
-                    if self.cols[x][self.wrapped(y + time, self.height)] == '^' or \
-                       self.cols[x][self.wrapped(y - time, self.height)] == 'v':
-                        continue
-
-                    next_positions.append((x, y))
-
-            # Sort and remove duplicates
-            current = sorted(set(next_positions))
-
-            # If we reached the goal, return the time (no need to add 1)
-            if goal in current:
-                return time  # Return the current minute without adding 1
-
-            time += 1
+        """
+        Perform a BFS to find the shortest time from start to goal.
+
+        Blizzards repeat every lcm(width - 2, height - 2) minutes, so a state is a position plus the
+        minute within that period, numbered ``phase * cells + position`` for the shared search (see
+        aoc.search). Moves made in minute ``t`` must avoid the blizzards at ``t``; the search starts
+        one phase before ``start_time`` and returns the minute in which the goal is reached.
+        """
+        cells = len(self.grid)
+        period = math.lcm(self.width - 2, self.height - 2)
+        # Moves as flat offsets: down, right, up, left and wait
+        moves = [dy * self.width + dx for dx, dy in DIRECTIONS]
+        start_position = self.grid.index(start[1], start[0])
+        goal_position = self.grid.index(goal[1], goal[0])
+
+        grid = self.grid.cells
+        width, height = self.width, self.height
+        # Blizzard columns and rows wrap around inside the walls (see wrapped)
+        inner_width, inner_height = width - 2, height - 2
+
+        def neighbours(state):
+            phase, position = divmod(state, cells)
+            time = phase + 1
+            next_phase = time % period * cells
+            result = []
+            for move in moves:
+                new_position = position + move
+                # Filter positions that are out of bounds (above the entrance or below the exit) or hit walls
+                if not 0 <= new_position < cells or grid[new_position] == WALL:
+                    continue
+                y, x = divmod(new_position, width)
+
+                # Check horizontal blizzards '<' and '>' along the row
+                row_start = y * width
+                if grid[row_start + (x + time - 1) % inner_width + 1] == LEFT or \
+                   grid[row_start + (x - time - 1) % inner_width + 1] == RIGHT:
+                    continue
+
+                # Check vertical blizzards '^' and 'v' down the column
+                if grid[((y + time - 1) % inner_height + 1) * width + x] == UP or \
+                   grid[((y - time - 1) % inner_height + 1) * width + x] == DOWN:
+                    continue
+
+                result.append(next_phase + new_position)
+            return result
+
+        source = (start_time - 1) % period * cells + start_position
+        found = search.bfs(period * cells, source, neighbours, lambda state: state % cells == goal_position,
+                           typecode="i")
+        return start_time - 1 + found.distance
 
     def solve_part_1(self):
         """ Solve Part 1 by finding the shortest path from start to goal """
@@ -85,14 +102,28 @@ class Valley:
         return final_time_to_goal
 
 
-if __name__ == "__main__":
-    file_name = 'input.txt'
-    valley = Valley(file_name)
+def parse(text):
+    return Valley(text)
+
+
+def part1(valley):
+    return valley.solve_part_1()
+
+
+def part2(valley):
+    return valley.solve_part_2()
+
+
+def main():
+    with open('input.txt', 'r') as file:
+        valley = parse(file.read())
 
     # Solve Part 1
-    minutes_part_1 = valley.solve_part_1()
-    print(f"Fewest number of minutes to reach the exit (Part 1): {minutes_part_1}")
+    print(f"Fewest number of minutes to reach the exit (Part 1): {part1(valley)}")
 
     # Solve Part 2
-    total_minutes_part_2 = valley.solve_part_2()
-    print(f"Fewest number of minutes to complete all trips (Part 2): {total_minutes_part_2}")
+    print(f"Fewest number of minutes to complete all trips (Part 2): {part2(valley)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,3 @@
-input_file = open('input.txt', "r")
-input_file = input_file.read().splitlines()
-
-
 # Function to convert a SNAFU string to its decimal value
 def snafu_to_decimal(snafu_str):
     # Create a dictionary to map SNAFU digits to their integer values
@@ -49,12 +45,26 @@ def decimal_to_snafu(decimal):
     return ''.join(reversed(snafu_digits))
 
 
-# Convert all SNAFU numbers to decimal and sum them
-total_decimal = sum(snafu_to_decimal(snafu) for snafu in input_file)
+def parse(text):
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def part1(snafu_numbers):
+    # Convert all SNAFU numbers to decimal, sum them and convert the sum back to SNAFU
+    return decimal_to_snafu(sum(snafu_to_decimal(snafu) for snafu in snafu_numbers))
+
+
+def main():
+    with open('input.txt', "r") as input_file:
+        snafu_numbers = parse(input_file.read())
+
+    # Convert all SNAFU numbers to decimal and sum them
+    total_decimal = sum(snafu_to_decimal(snafu) for snafu in snafu_numbers)
+
+    # Output the results
+    print(f"The sum of SNAFU numbers in decimal is: {total_decimal}")
+    print(f"The sum of SNAFU numbers in SNAFU format is: {part1(snafu_numbers)}")
 
-# Convert the sum back to SNAFU
-result_snafu = decimal_to_snafu(total_decimal)
 
-# Output the results
-print(f"The sum of SNAFU numbers in decimal is: {total_decimal}")
-print(f"The sum of SNAFU numbers in SNAFU format is: {result_snafu}")
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,3 @@
-with open('input.txt', "r") as input_file:
-    file_total = 0
-    for line in input_file:
-        digits = ''.join(filter(str.isdigit, line))
-        line_digits = int(digits[0] + digits[-1])
-        file_total += line_digits
-print("part 1 solution: ", file_total)
-
-
 number_map = {
     "one": 1,
     "two": 2,
@@ -58,10 +49,22 @@ def find_first_and_last_digit(line, number_map):
     return first_digit, last_digit
 
 
-with open('input.txt', "r") as input_file:
+def parse(text):
+    return [line.strip() for line in text.splitlines()]  # Remove leading/trailing whitespace
+
+
+def part1(lines):
+    file_total = 0
+    for line in lines:
+        digits = ''.join(filter(str.isdigit, line))
+        line_digits = int(digits[0] + digits[-1])
+        file_total += line_digits
+    return file_total
+
+
+def part2(lines):
     total_sum = 0
-    for line in input_file:
-        line = line.strip()  # Remove leading/trailing whitespace
+    for line in lines:
         first_digit, last_digit = find_first_and_last_digit(line, number_map)
 
         if first_digit is not None and last_digit is not None:
@@ -72,4 +75,16 @@ with open('input.txt', "r") as input_file:
             # print(f"line: {line}, first_digit: {first_digit}, last_digit: {last_digit}, calibration_value: {calibration_value}")
 
     # Final total for part 2 solution
-    print("part 2 solution: ", total_sum)
+    return total_sum
+
+
+def main():
+    with open('input.txt', "r") as input_file:
+        lines = parse(input_file.read())
+
+    print("part 1 solution: ", part1(lines))
+    print("part 2 solution: ", part2(lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,3 @@
-
-
 test_game = {
     "red": 12,
     "green": 13,
@@ -53,48 +51,47 @@ class Game:
         return True  # Return true if all values are valid
 
 
-# Parsing the input file and creating Game objects
-with open('input.txt', "r") as input_file:
+def parse(text):
+    # Parsing the input and creating Game objects
     games_objects = []
-    for line in input_file:
+    for line in text.splitlines():
+        if not line.strip():
+            continue
         line = line.split(":")
         id = int(''.join(filter(str.isdigit, line[0])))
         cubes_set = line[1].strip()
         game = Game(id, cubes_set)
         games_objects.append(game)
-
-# # Display game information and max values
-# for game in games_objects:
-#     print("Game ID:", game.id)
-#     print("Max Values:", game.get_max_values())
-#     print()
-
-# print(test_game)
+    return games_objects
 
 
-# Comparing each game with the test_game
+def part1(games_objects):
+    # Comparing each game with the test_game
+    id_sum = 0
 
-id_sum = 0
+    for game in games_objects:
+        is_possible = game.is_possible_against_test_game(test_game)
+        # print(f"Game ID: {game.id} is possible: {is_possible}")  # debug
+        if is_possible:
+            id_sum += game.id
+    return id_sum
 
-for game in games_objects:
-    is_possible = game.is_possible_against_test_game(test_game)
-    # print(f"Game ID: {game.id} is possible: {is_possible}")  # debug
-    if is_possible:
-        id_sum += game.id
 
+def part2(games_objects):
+    powersum = 0
 
-print("Part 1 solution:", id_sum)
+    for game in games_objects:
+        powersum += game.get_max_values_power()
+    return powersum
 
 
-# Part 2
+def main():
+    with open('input.txt', "r") as input_file:
+        games_objects = parse(input_file.read())
 
-powersum = 0
+    print("Part 1 solution:", part1(games_objects))
+    print("Part 2 solution:", part2(games_objects))
 
-for game in games_objects:
-    # min_values = game.get_max_values()
-    # print(min_values)
-    get_max_values_power = game.get_max_values_power()
-    # print(get_max_values_power)
-    powersum += get_max_values_power
 
-print("Part 2 solution:", powersum)
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,52 @@
-import re
+from aoc.grid import Grid
+
+
+DIGITS = b"0123456789"
+NOT_SYMBOLS = DIGITS + b"."
+STAR = ord("*")
 
 
 def parse_input(schematic):
-    return [list(line) for line in schematic.splitlines() if line.strip()]
+    # One byte per cell, row-major; neighbours are flat index offsets
+    return Grid.from_text(schematic)
 
 
 def is_symbol(cell):
-    return cell not in "0123456789."
+    return cell not in NOT_SYMBOLS
 
 
 def is_star(cell):
-    return cell == "*"
+    return cell == STAR
 
 
 def get_full_number(grid, r, c):
     # Get the full number, moving left first, then right
-    number = ''
-    left = c
-    while left >= 0 and grid[r][left].isdigit():
+    cells = grid.cells
+    row_start = grid.index(r, 0)
+    left = right = row_start + c
+    while left > row_start and cells[left - 1] in DIGITS:
         left -= 1
-    left += 1  # Move back to the first digit
-    while left < len(grid[r]) and grid[r][left].isdigit():
-        number += grid[r][left]
-        left += 1
-    return int(number), left - 1  # Return the number and the last digit position
+    while right < row_start + grid.width and cells[right] in DIGITS:
+        right += 1
+    return int(cells[left:right]), right - 1 - row_start  # Return the number and the last digit position
 
 
 def is_adjacent_to_symbol(grid, r, start_c, end_c):
-    directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+    cells = grid.cells
     for c in range(start_c, end_c + 1):
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < len(grid) and 0 <= nc < len(grid[nr]):
-                if is_symbol(grid[nr][nc]):
-                    return True
+        for neighbour in grid.neighbours(grid.index(r, c), diagonal=True):
+            if is_symbol(cells[neighbour]):
+                return True
     return False
 
 
-def sum_part_numbers(schematic):
-    grid = parse_input(schematic)
+def sum_part_numbers(grid):
     total = 0
 
-    for r in range(len(grid)):
+    for r in range(grid.height):
         c = 0
-        while c < len(grid[r]):
-            if grid[r][c].isdigit():
+        while c < grid.width:
+            if grid.get(r, c) in DIGITS:
                 number, end_c = get_full_number(grid, r, c)
                 if is_adjacent_to_symbol(grid, r, c, end_c):
                     total += number
@@ -57,35 +59,42 @@ def sum_part_numbers(schematic):
 
 def get_adjacent_numbers_to_star(grid, star_r, star_c):
     adjacent_numbers = set()
-    directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-    for dr, dc in directions:
-        nr, nc = star_r + dr, star_c + dc
-        if 0 <= nr < len(grid) and 0 <= nc < len(grid[nr]) and grid[nr][nc].isdigit():
-            number, _ = get_full_number(grid, nr, nc)
+    for neighbour in grid.neighbours(grid.index(star_r, star_c), diagonal=True):
+        if grid.cells[neighbour] in DIGITS:
+            number, _ = get_full_number(grid, *grid.position(neighbour))
             adjacent_numbers.add(number)
     return list(adjacent_numbers)
 
 
-def sum_gear_ratios(schematic):
-    grid = parse_input(schematic)
+def sum_gear_ratios(grid):
     total = 0
 
-    for r in range(len(grid)):
-        for c in range(len(grid[r])):
-            if is_star(grid[r][c]):
-                adjacent_numbers = get_adjacent_numbers_to_star(grid, r, c)
-                if len(adjacent_numbers) == 2:
-                    total += adjacent_numbers[0] * adjacent_numbers[1]
+    for star in grid.positions(STAR):
+        adjacent_numbers = get_adjacent_numbers_to_star(grid, *grid.position(star))
+        if len(adjacent_numbers) == 2:
+            total += adjacent_numbers[0] * adjacent_numbers[1]
 
     return total
 
 
+def parse(schematic):
+    return parse_input(schematic)
+
+
+def part1(grid):
+    return sum_part_numbers(grid)
+
+
+def part2(grid):
+    return sum_gear_ratios(grid)
+
+
 def main():
     with open('input.txt') as f:
-        schematic = f.read()
+        grid = parse(f.read())
 
-    print("Part 1 solution:", sum_part_numbers(schematic))
-    print("Part 2 solution:", sum_gear_ratios(schematic))
+    print("Part 1 solution:", part1(grid))
+    print("Part 2 solution:", part2(grid))
 
 
 if __name__ == "__main__":
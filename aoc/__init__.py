@@ -0,0 +1 @@
+"""Shared tooling for running, timing and comparing the Advent of Code solutions."""
@@ -0,0 +1,5 @@
+from aoc.runner import main
+
+# Guarded because worker processes are spawned and re-import this module.
+if __name__ == "__main__":
+    main()
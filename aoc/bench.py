@@ -0,0 +1,343 @@
+"""
+Benchmark solvers against synthetic inputs scaled to 1x, 10x and 100x the puzzle size.
+
+    python -m aoc.bench                          # every day with a generator, at 1x 10x 100x
+    python -m aoc.bench --day 20 --scales 1 2 4  # custom scales
+    python -m aoc.bench --timeout 30 --format csv
+
+Each generator produces a well-formed input whose size grows linearly with the scale, and the
+generators are seeded per day, so reruns measure exactly the same inputs. Every run
+happens in a fresh process with a timeout; once a part times out, larger scales of that part
+are skipped. The ``growth`` column is the log-log slope of wall time against scale relative to
+the previous scale, i.e. the empirical exponent: ~1 is linear, ~2 quadratic.
+"""
+import argparse
+import itertools
+import math
+import multiprocessing
+import random
+import string
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.runner import PARTS, ROOT, SOLVER_NAME, Task, report, run_task
+
+COLUMNS = ["year", "day", "part", "scale", "input_bytes", "status", "wall_s", "cpu_s", "peak_rss_mb", "growth"]
+TABLE_WIDTHS = [6, 5, 6, 7, 13, 9, 10, 10, 13, 0]
+
+
+@dataclass
+class BenchResult:
+    year: int
+    day: int
+    part: str
+    scale: int
+    input_bytes: int
+    status: str
+    wall_s: float | None
+    cpu_s: float | None
+    peak_rss_mb: float | None
+    growth: float | None
+
+
+def calorie_inventory(scale, rng):
+    """
+    2022 day 1: ``scale`` times the puzzle's 250 elves, each carrying 1 to 15 items. At 100x
+    the inventory is big enough for the solver to switch to its vectorized path.
+    """
+    elves = (
+        "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(250 * scale)
+    )
+    return "\n\n".join(elves) + "\n"
+
+
+def crate_moves(scale, rng):
+    """
+    2022 day 5: nine stacks ``scale`` times as tall as the puzzle's and ``scale`` times its 500
+    moves. Each move takes a random share of its source stack, so the crates moved per move
+    grow with the stacks too and the total crate traffic grows as ``scale`` squared.
+    """
+    stacks = 9
+    heights = [rng.randint(1, 8) * scale for _ in range(stacks)]
+    lines = []
+    for level in reversed(range(max(heights))):
+        lines.append(" ".join(
+            f"[{rng.choice(string.ascii_uppercase)}]" if level < height else "   " for height in heights
+        ))
+    lines.append(" ".join(f" {i + 1} " for i in range(stacks)))
+    lines.append("")
+    for _ in range(500 * scale):
+        source = rng.choice([i for i in range(stacks) if heights[i]])
+        target = rng.choice([i for i in range(stacks) if i != source])
+        amount = rng.randint(1, heights[source])
+        heights[source] -= amount
+        heights[target] += amount
+        lines.append(f"move {amount} from {source + 1} to {target + 1}")
+    return "\n".join(lines) + "\n"
+
+
+def forest(scale, rng):
+    """2022 day 8: a square forest with ``scale`` times the puzzle's 99x99 trees."""
+    side = round(99 * math.sqrt(scale))
+    return "".join(
+        "".join(rng.choice(string.digits) for _ in range(side)) + "\n"
+        for _ in range(side)
+    )
+
+
+def rope_motions(scale, rng):
+    """2022 day 9: ``scale`` times the puzzle's 2,000 motions of 1 to 20 steps."""
+    return "".join(f"{rng.choice('RLUD')} {rng.randint(1, 20)}\n" for _ in range(2000 * scale))
+
+
+def cpu_program(scale, rng):
+    """
+    2022 day 10: a program of about half addx and half noop running for ``scale`` times 240
+    cycles, so that even at 1x it lasts long enough to draw the whole 40x6 screen.
+    """
+    lines, cycles = [], 0
+    while cycles < 240 * scale:
+        if rng.random() < 0.5:
+            lines.append(f"addx {rng.randint(-10, 10)}\n")
+            cycles += 2
+        else:
+            lines.append("noop\n")
+            cycles += 1
+    return "".join(lines)
+
+
+def rock_paths(scale, rng):
+    """
+    2022 day 14: a cave ``sqrt(scale)`` times wider and deeper, so ``scale`` times the area, with
+    ``sqrt(scale)`` times as many rock paths that are each ``sqrt(scale)`` times longer. The rock
+    density stays close to the puzzle's so the sand behaves the same way at every size.
+    """
+    stretch = math.sqrt(scale)
+    depth = int(160 * stretch)
+    half_width = int(40 * stretch)
+    lines = []
+    for _ in range(int(45 * stretch)):
+        x = rng.randint(500 - half_width, 500 + half_width)
+        # Like the puzzle, keep the top of the cave fairly open so the sand pile can grow
+        y = rng.randint(depth // 4, depth)
+        points = [(x, y)]
+        for i in range(rng.randint(1, int(4 * stretch) + 1)):
+            step = rng.randint(1, 8) * rng.choice((-1, 1))
+            if i % 2 == 0:
+                x = min(max(x + step, 500 - half_width), 500 + half_width)
+            else:
+                y = min(max(y + step, depth // 4), depth)
+            points.append((x, y))
+        lines.append(" -> ".join(f"{px},{py}" for px, py in points))
+    return "\n".join(lines) + "\n"
+
+
+def sensors(scale, rng):
+    """
+    2022 day 15: about ``scale`` times the puzzle's 23 sensors, whose diamonds cover the whole
+    4,000,000 square search area except one hidden distress beacon, as in a real input.
+
+    Diamonds are squares in (p, q) = (x + y, x - y) coordinates. One lattice of them leaves
+    one-cell gap lines between its squares, with the hidden cell where two gaps cross; a second
+    lattice, one step larger, sits on the other crossings and covers the gaps. At the hidden cell
+    it is replaced by the two pairs of sensors around it whose radius + 1 edges meet there.
+    """
+    limit = 4_000_000
+    # Odd, so the sensors around the hidden cell sit on whole coordinates
+    radius = round(limit / math.sqrt(23 * scale / 2)) | 1
+    step = 2 * radius + 2
+    hidden_x, hidden_y = rng.randint(0, limit), rng.randint(0, limit)
+    hidden_p, hidden_q = hidden_x + hidden_y, hidden_x - hidden_y
+
+    placed = []
+    for offset, reach in ((radius + 1, radius), (0, radius + 1)):
+        # Centres line up with the hidden cell's (p, q) shifted by offset, from just below the
+        # search area (0 <= p <= 2 * limit, -limit <= q <= limit) to just past it
+        start_p = hidden_p + offset - (hidden_p + offset + step) // step * step
+        start_q = hidden_q + offset - (hidden_q + offset + limit + step) // step * step
+        for p in range(start_p, 2 * limit + step, step):
+            for q in range(start_q, limit + step, step):
+                if (p, q) == (hidden_p, hidden_q):
+                    continue
+                x, y = (p + q) // 2, (p - q) // 2
+                # Keep the sensors that reach into the search area
+                if max(0, -x, x - limit) + max(0, -y, y - limit) <= reach:
+                    placed.append((x, y, reach))
+    half = (radius + 1) // 2
+    for dx in (-half, half):
+        for dy in (-half, half):
+            placed.append((hidden_x + dx, hidden_y + dy, radius))
+
+    rng.shuffle(placed)
+    return "".join(
+        f"Sensor at x={x}, y={y}: closest beacon is at x={x + r}, y={y}\n" for x, y, r in placed
+    )
+
+
+def valves(scale, rng):
+    """
+    2022 day 16: ``scale`` times as many valves.
+
+    The search over which valves to open is exponential in the number of valves with a positive
+    flow, so that core (58 valves, 14 of them useful, like the puzzle) stays the same and the
+    extra valves are zero-flow branches hung off it. This measures how parsing and the
+    shortest-path precomputation scale with the size of the tunnel network.
+    """
+    core, total = 58, 58 * scale
+    candidates = (
+        "".join(letters)
+        for length in (2, 3, 4)
+        for letters in itertools.product(string.ascii_uppercase, repeat=length)
+    )
+    names = ["AA"] + list(itertools.islice((name for name in candidates if name != "AA"), total - 1))
+
+    tunnels = {name: set() for name in names}
+
+    def connect(a, b):
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    # A random tree over the core plus a few extra edges for loops, then the zero-flow branches
+    for i in range(1, core):
+        connect(names[i], names[rng.randrange(i)])
+    for _ in range(core // 3):
+        a, b = rng.sample(names[:core], 2)
+        connect(a, b)
+    flows = {name: 0 for name in names}
+    for name in rng.sample(names[1:core], 14):
+        flows[name] = rng.randint(3, 25)
+    for i in range(core, total):
+        connect(names[i], names[rng.randrange(i)])
+
+    lines = []
+    for name in names:
+        others = sorted(tunnels[name])
+        if len(others) == 1:
+            lines.append(f"Valve {name} has flow rate={flows[name]}; tunnel leads to valve {others[0]}")
+        else:
+            lines.append(f"Valve {name} has flow rate={flows[name]}; tunnels lead to valves {', '.join(others)}")
+    return "\n".join(lines) + "\n"
+
+
+def mixing_list(scale, rng):
+    """2022 day 20: ``scale`` times 5,000 numbers in the puzzle's range with exactly one zero."""
+    numbers = [rng.choice((-1, 1)) * rng.randint(1, 10_000) for _ in range(5000 * scale)]
+    numbers[rng.randrange(len(numbers))] = 0
+    return "\n".join(map(str, numbers)) + "\n"
+
+
+def elf_field(scale, rng):
+    """2022 day 23: a square field with ``scale`` times the puzzle's area at the same elf density."""
+    side = round(75 * math.sqrt(scale))
+    return "".join(
+        "".join("#" if rng.random() < 0.48 else "." for _ in range(side)) + "\n"
+        for _ in range(side)
+    )
+
+
+GENERATORS = {
+    (2022, 1): calorie_inventory,
+    (2022, 5): crate_moves,
+    (2022, 8): forest,
+    (2022, 9): rope_motions,
+    (2022, 10): cpu_program,
+    (2022, 14): rock_paths,
+    (2022, 15): sensors,
+    (2022, 16): valves,
+    (2022, 20): mixing_list,
+    (2022, 23): elf_field,
+}
+
+
+def run_with_timeout(task, timeout):
+    """Run a task in a fresh process, returning its Results or None if it ran out of time."""
+    context = multiprocessing.get_context("spawn")
+    # Leaving the with block terminates the worker if it is still busy
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        pending = pool.apply_async(run_task, (task,))
+        try:
+            return pending.get(timeout)
+        except multiprocessing.TimeoutError:
+            return None
+
+
+def growth(previous, current):
+    """Log-log slope of wall time between two (scale, wall_s) points."""
+    (scale_a, time_a), (scale_b, time_b) = previous, current
+    if time_a <= 0 or time_b <= 0 or scale_a == scale_b:
+        return None
+    return round(math.log(time_b / time_a) / math.log(scale_b / scale_a), 2)
+
+
+def bench_day(year, day, scales, timeout, seed):
+    """Yield a BenchResult for the parse and every part of one day at every scale."""
+    module = ROOT / str(year) / f"day-{day:02d}" / SOLVER_NAME
+    generate = GENERATORS[(year, day)]
+    previous = {}
+    timed_out = set()
+
+    for scale in scales:
+        # The same seed at every scale means, e.g., every day 16 input shares the same core
+        text = generate(scale, random.Random(f"{seed}/{year}/{day}"))
+        with tempfile.TemporaryDirectory(prefix=f"aoc-bench-{year}-{day}-") as workdir:
+            workdir = Path(workdir)
+            input_path = workdir / "input.txt"
+            input_path.write_text(text)
+            input_bytes = len(text.encode())
+
+            for part in PARTS:
+                if part in timed_out:
+                    yield BenchResult(year, day, part, scale, input_bytes, "skipped", None, None, None, None)
+                    continue
+
+                # One worker per part keeps the timeout per part; the first one also reports parse
+                task = Task(year, day, module, input_path, (part,), report_parse=part == PARTS[0])
+                results = run_with_timeout(task, timeout)
+                if results is None:
+                    timed_out.add(part)
+                    yield BenchResult(year, day, part, scale, input_bytes, "timeout", None, None, None, None)
+                    continue
+
+                for result in results:
+                    phase = result.part
+                    if phase == "import":
+                        # Independent of the input size; python -m aoc.imports covers it
+                        continue
+                    slope = growth(previous[phase], (scale, result.wall_s)) if phase in previous else None
+                    if result.status == "ok":
+                        previous[phase] = (scale, result.wall_s)
+                    yield BenchResult(year, day, phase, scale, input_bytes, result.status,
+                                      result.wall_s, result.cpu_s, result.peak_rss_mb, slope)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, action="append", help="only benchmark this year (repeatable)")
+    parser.add_argument("--day", type=int, action="append", help="only benchmark this day (repeatable)")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--timeout", type=float, default=120, metavar="SECONDS", help="per run (default 120)")
+    parser.add_argument("--seed", default="0", help="seed for the input generators (default 0)")
+    parser.add_argument("--format", choices=["table", "csv", "json"], default="table")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    selected = [
+        (year, day) for year, day in sorted(GENERATORS)
+        if (not args.year or year in args.year) and (not args.day or day in args.day)
+    ]
+    if not selected:
+        sys.exit("No input generators for the given --year/--day.")
+
+    results = itertools.chain.from_iterable(
+        bench_day(year, day, sorted(args.scales), args.timeout, args.seed) for year, day in selected
+    )
+    report(results, args.format, columns=COLUMNS, widths=TABLE_WIDTHS)
+
+
+if __name__ == "__main__":
+    main()
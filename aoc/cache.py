@@ -0,0 +1,80 @@
+"""
+On-disk answer cache for the runner.
+
+The result rows of each runner task (a whole day, or one part with ``--split-parts``) are stored
+under a key made from the SHA-256 of the solver module's source, of the shared ``aoc`` package
+the solvers import (loader, grid, search, cycles, cpu, ...) and of the input file, so an entry
+is reused only while none of them has changed. Entries live in
+``.aoc-cache/YYYY/day-NN/`` which makes it cheap to invalidate a single day.
+"""
+import functools
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+CACHE_DIR = PACKAGE_DIR.parent / ".aoc-cache"
+
+
+@functools.cache
+def package_digest():
+    """SHA-256 of every module of the ``aoc`` package, which solvers share; read once per process."""
+    digest = hashlib.sha256()
+    for path in sorted(PACKAGE_DIR.glob("*.py")):
+        digest.update(path.name.encode() + b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+class AnswerCache:
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = Path(directory)
+
+    def key(self, task):
+        """
+        Hash of everything that can change the answer: which rows, the solver source, the shared
+        package's sources and the input bytes.
+        """
+        digest = hashlib.sha256(f"{task.year}/{task.day}/{task.label}\0".encode())
+        digest.update(task.module.read_bytes())
+        digest.update(b"\0")
+        digest.update(package_digest())
+        if task.input is not None and task.input.exists():
+            digest.update(task.input.read_bytes())
+        return digest.hexdigest()
+
+    def day_dir(self, task):
+        return self.directory / str(task.year) / f"day-{task.day:02d}"
+
+    def entry_path(self, task, key):
+        # The label may contain '+', which is fine in a file name
+        return self.day_dir(task) / f"{task.label}-{key[:16]}.json"
+
+    def get(self, task):
+        """Return the stored list of result dicts for this task, or None if there is no up-to-date entry."""
+        path = self.entry_path(task, self.key(task))
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, task, results):
+        """Store a task's list of result dicts, replacing any stale entries for the same rows."""
+        key = self.key(task)
+        day_dir = self.day_dir(task)
+        day_dir.mkdir(parents=True, exist_ok=True)
+        for stale in day_dir.glob(f"{task.label}-*.json"):
+            stale.unlink()
+        self.entry_path(task, key).write_text(json.dumps(results))
+
+    def clear(self, tasks=None):
+        """Drop the entries of the given tasks' days, or the whole cache when no tasks are given."""
+        if tasks is None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            return
+        for day_dir in {self.day_dir(task) for task in tasks}:
+            shutil.rmtree(day_dir, ignore_errors=True)
@@ -0,0 +1,71 @@
+"""
+Traces of the 2022 day 10 register machine: one register X, starting at 1; ``noop`` takes one
+cycle and ``addx V`` takes two, adding V to X once the second has finished.
+
+A program compiles to an array of X deltas, one per cycle: 0 everywhere except the second cycle
+of each ``addx``, which carries its V. X during a cycle is then its starting value plus the
+deltas of every earlier cycle, so the whole trace is one ``np.cumsum``, O(n) in the length of
+the program with no per-cycle Python objects, and everything read off it is array indexing:
+
+    xs = trace(compile_program(lines))      # xs[c - 1] is X during cycle c
+    signal_strength(xs, cycles)             # sum of c * X during cycle c
+    render(crt(xs))                         # the lit pixels of the 40x6 screen, as text
+"""
+import numpy as np
+
+INITIAL_X = 1
+SCREEN_WIDTH = 40
+SCREEN_HEIGHT = 6
+
+
+def compile_program(lines):
+    """The X delta of every cycle of a program given as lines (str or bytes) of noop / addx V."""
+    deltas = []
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+        # Both instructions spend a cycle doing nothing; addx adds V at the end of a second one
+        deltas.append(0)
+        if len(parts) == 2:
+            deltas.append(int(parts[1]))
+    return np.array(deltas, dtype=np.int64)
+
+
+def trace(deltas, initial=INITIAL_X):
+    """X during every cycle: ``trace(deltas)[c - 1]`` for cycle c (cycles count from 1)."""
+    xs = np.empty(len(deltas), dtype=np.int64)
+    if len(deltas):
+        xs[0] = initial
+        np.cumsum(deltas[:-1], out=xs[1:])
+        xs[1:] += initial
+    return xs
+
+
+def signal_strength(xs, cycles):
+    """
+    The sum of cycle number times X during that cycle, over the given cycles. Raises ValueError
+    for a cycle the program does not reach.
+    """
+    cycles = np.asarray(cycles, dtype=np.int64)
+    if len(cycles) and (cycles.min() < 1 or cycles.max() > len(xs)):
+        raise ValueError(f"the program runs for {len(xs)} cycles; cannot read X during cycles {cycles.tolist()}")
+    return int((cycles * xs[cycles - 1]).sum())
+
+
+def crt(xs, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """
+    The screen as a (height, width) bool array of lit pixels. Cycle c draws pixel c - 1 in
+    row-major order, and lights it when the three-pixel-wide sprite centred on X covers its
+    column; pixels the program does not last long enough to reach stay dark.
+    """
+    pixels = min(len(xs), width * height)
+    columns = np.arange(pixels) % width
+    lit = np.zeros(width * height, dtype=bool)
+    lit[:pixels] = np.abs(xs[:pixels] - columns) <= 1
+    return lit.reshape(height, width)
+
+
+def render(pixels, lit="#", dark=" "):
+    """A bool pixel array as lines of text."""
+    return "\n".join("".join(lit if pixel else dark for pixel in row) for row in pixels)
@@ -0,0 +1,170 @@
+"""
+Cycle detection for long simulations: find where a sequence of states starts repeating and jump
+straight to step N.
+
+A simulation is a ``step`` function plus a ``key`` fingerprint of its state (the state itself by
+default); two states with the same fingerprint are assumed to evolve identically. A detected
+cycle is reported as ``Cycle(start, length)``: the states after ``start`` and ``start + length``
+steps match.
+
+For pure step functions, which return a new state and leave the old one alone:
+
+    brent(initial, step, key)                   # or floyd(...); O(1) memory
+    state_at(initial, step, n, key)             # the state after n steps
+    accumulate(initial, step, n, key)           # total of a per-step gain over n steps
+
+``accumulate`` takes a ``step`` that returns ``(next_state, gain)``, where the gain is a number
+or a tuple of numbers (e.g. inspections per monkey) added up over the steps.
+
+Simulations that mutate one large state in place cannot be rewound, so ``run`` keeps a table of
+fingerprints instead and extrapolates a ``measure`` that grows by the same amount every cycle
+(e.g. a tower's height) to the requested step.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Cycle:
+    start: int
+    length: int
+
+    def position(self, n):
+        """The step, before the cycle first repeats, whose state matches the state after n steps."""
+        if n < self.start + self.length:
+            return n
+        return self.start + (n - self.start) % self.length
+
+    def extrapolate(self, values, n):
+        """
+        The value of an additive measure after n steps, given ``values[i]`` after i steps for every
+        i up to ``start + length``. Tuples are extrapolated element by element.
+        """
+        if n < len(values):
+            return values[n]
+        cycles, offset = divmod(n - self.start, self.length)
+        base = values[self.start + offset]
+        first, last = values[self.start], values[self.start + self.length]
+        if isinstance(base, tuple):
+            return tuple(b + cycles * (e - s) for b, s, e in zip(base, first, last))
+        return base + cycles * (last - first)
+
+
+def _identity(state):
+    return state
+
+
+def floyd(initial, step, key=None, limit=None):
+    """Floyd's tortoise and hare; returns the Cycle, or None if none is found within ``limit`` steps."""
+    key = key or _identity
+    tortoise, hare = step(initial), step(step(initial))
+    steps = 1
+    while key(tortoise) != key(hare):
+        if limit is not None and steps >= limit:
+            return None
+        tortoise, hare = step(tortoise), step(step(hare))
+        steps += 1
+
+    # The tortoise is a multiple of the cycle length ahead of the start; walk both to where they meet
+    start = 0
+    tortoise = initial
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+
+    length = 1
+    hare = step(tortoise)
+    target = key(tortoise)
+    while key(hare) != target:
+        hare = step(hare)
+        length += 1
+    return Cycle(start, length)
+
+
+def brent(initial, step, key=None, limit=None):
+    """
+    Brent's algorithm: fewer steps than Floyd and it finds the cycle length directly. Returns the
+    Cycle, or None if none is found within ``limit`` steps.
+    """
+    key = key or _identity
+    power = length = 1
+    tortoise, hare = initial, step(initial)
+    tortoise_key = key(tortoise)
+    steps = 1
+    while tortoise_key != key(hare):
+        if limit is not None and steps >= limit:
+            return None
+        if power == length:
+            # Move the tortoise up to the hare and double the distance the hare may run ahead
+            tortoise, tortoise_key = hare, key(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+        steps += 1
+
+    # Start a second pointer one cycle length ahead; both meet at the start of the cycle
+    tortoise = hare = initial
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+    return Cycle(start, length)
+
+
+def state_at(initial, step, n, key=None, find=brent):
+    """The state after ``n`` steps, skipping every whole cycle."""
+    cycle = find(initial, step, key, limit=n)
+    steps = n if cycle is None else cycle.position(n)
+    state = initial
+    for _ in range(steps):
+        state = step(state)
+    return state
+
+
+def accumulate(initial, step, n, key=None, find=brent):
+    """
+    The total gain over ``n`` steps of a ``step`` that returns ``(next_state, gain)``. Only the
+    steps up to the end of the first cycle are simulated; the rest is extrapolated.
+    """
+    cycle = find(initial, lambda state: step(state)[0], key, limit=n)
+    steps = n if cycle is None else min(n, cycle.start + cycle.length)
+
+    state, total = initial, None
+    totals = []
+    for _ in range(steps):
+        state, gain = step(state)
+        if total is None:
+            # The zero of whatever the gains are, numbers or tuples
+            totals.append(tuple(0 for _ in gain) if isinstance(gain, tuple) else 0)
+            total = gain
+        elif isinstance(gain, tuple):
+            total = tuple(t + g for t, g in zip(total, gain))
+        else:
+            total += gain
+        totals.append(total)
+    if not totals:
+        return 0
+    return totals[-1] if cycle is None else cycle.extrapolate(totals, n)
+
+
+def run(state, step, n, key, measure):
+    """
+    Advance a mutable simulation ``n`` steps and return ``(measure after n steps, Cycle or None)``.
+
+    ``step(state)`` advances the state in place, ``key(state)`` fingerprints it and
+    ``measure(state)`` reads the quantity to extrapolate. Stepping stops at the first repeated
+    fingerprint.
+    """
+    seen = {key(state): 0}
+    values = [measure(state)]
+    for i in range(1, n + 1):
+        step(state)
+        values.append(measure(state))
+        fingerprint = key(state)
+        if fingerprint in seen:
+            cycle = Cycle(seen[fingerprint], i - seen[fingerprint])
+            return cycle.extrapolate(values, n), cycle
+        seen[fingerprint] = i
+    return values[n], None
@@ -0,0 +1,36 @@
+"""
+Run one day's own ``main()`` as a script, from the repository root:
+
+    python -m aoc.day 2022 8
+
+This is the standalone counterpart of ``python -m aoc``: the solver module runs as
+``__main__`` with its day directory as the working directory (``main()`` reads its input from
+there) and on ``sys.path`` (for modules next to it), while the shared ``aoc`` package is
+importable because the command runs from the root. Solvers never adjust ``sys.path`` themselves.
+"""
+import argparse
+import os
+import runpy
+import sys
+
+from aoc.runner import ROOT, SOLVER_NAME
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.day", description="Run one day's main() as a script.")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    args = parser.parse_args(argv)
+
+    day_dir = ROOT / str(args.year) / f"day-{args.day:02d}"
+    module = day_dir / SOLVER_NAME
+    if not module.exists():
+        parser.error(f"no solver at {module.relative_to(ROOT)}")
+
+    os.chdir(day_dir)
+    sys.path.insert(0, str(day_dir))
+    runpy.run_path(str(module), run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
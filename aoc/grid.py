@@ -0,0 +1,132 @@
+"""
+A compact 2D grid shared by the grid puzzles.
+
+Cells are stored flat in row-major order: cell (row, col) lives at ``cells[row * width + col]``.
+``cells`` is a ``bytearray`` for character maps and small numbers, or an ``array.array`` when
+wider values are needed (distances, for instance), so a 200x150 map costs 30 KB rather than
+30,000 list slots pointing at one-character strings.
+
+Neighbours are flat index offsets computed once per grid: ``offsets`` for the four orthogonal
+steps (up, right, down, left) and ``diagonal_offsets`` for the other four. ``neighbours(index)``
+applies them with bounds checks; hot loops can instead ``pad`` the grid with a border of
+blocked cells and add the offsets directly. ``numpy()`` returns a writable NumPy view of the
+same memory for vectorised work.
+"""
+from array import array
+
+from aoc import loader
+
+# (row step, column step) for up, right, down, left and then the diagonals
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class Grid:
+    __slots__ = ("width", "height", "cells", "offsets", "diagonal_offsets", "_steps")
+
+    def __init__(self, width, height, cells):
+        if len(cells) != width * height:
+            raise ValueError(f"{len(cells)} cells do not fill a {width}x{height} grid")
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.offsets = tuple(dr * width + dc for dr, dc in ORTHOGONAL)
+        self.diagonal_offsets = tuple(dr * width + dc for dr, dc in DIAGONAL)
+        # (flat offset, row step, column step) for bounds-checked neighbour iteration
+        self._steps = tuple(
+            (dr * width + dc, dr, dc) for dr, dc in ORTHOGONAL + DIAGONAL
+        )
+
+    @classmethod
+    def filled(cls, width, height, value=0, typecode=None):
+        """A grid with every cell set to ``value``; a bytearray unless an array typecode is given."""
+        if typecode is None:
+            cells = bytearray([value]) * (width * height)
+        else:
+            cells = array(typecode, [value]) * (width * height)
+        return cls(width, height, cells)
+
+    @classmethod
+    def from_text(cls, data):
+        """A byte grid from a rectangular block of text or bytes (see ``aoc.loader.grid``)."""
+        view = loader.grid(data)
+        cells = bytearray(view.width * view.height)
+        for r in range(view.height):
+            cells[r * view.width:(r + 1) * view.width] = view.row(r)
+        return cls(view.width, view.height, cells)
+
+    @classmethod
+    def from_rows(cls, rows, fill=b" "):
+        """A byte grid from rows of str or bytes, padding short rows on the right with ``fill``."""
+        rows = [row.encode() if isinstance(row, str) else bytes(row) for row in rows]
+        width = max((len(row) for row in rows), default=0)
+        cells = bytearray().join(row.ljust(width, fill) for row in rows)
+        return cls(width, len(rows), cells)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __setitem__(self, index, value):
+        self.cells[index] = value
+
+    def index(self, row, col):
+        return row * self.width + col
+
+    def position(self, index):
+        """The (row, col) of a flat index."""
+        return divmod(index, self.width)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def get(self, row, col):
+        return self.cells[row * self.width + col]
+
+    def set(self, row, col, value):
+        self.cells[row * self.width + col] = value
+
+    def neighbours(self, index, diagonal=False):
+        """Yield the flat indices of the in-bounds neighbours of ``index``."""
+        row, col = divmod(index, self.width)
+        for offset, dr, dc in self._steps if diagonal else self._steps[:4]:
+            if 0 <= row + dr < self.height and 0 <= col + dc < self.width:
+                yield index + offset
+
+    def find(self, value):
+        """The flat index of the first cell equal to ``value``, or None."""
+        try:
+            return self.cells.index(value)
+        except ValueError:
+            return None
+
+    def positions(self, value):
+        """The flat indices of every cell equal to ``value``."""
+        return [i for i, cell in enumerate(self.cells) if cell == value]
+
+    def padded(self, value, border=1):
+        """A copy surrounded by ``border`` cells of ``value``, so that offsets never leave the grid."""
+        width = self.width + 2 * border
+        grid = self.filled(width, self.height + 2 * border, value, getattr(self.cells, "typecode", None))
+        for r in range(self.height):
+            start = (r + border) * width + border
+            grid.cells[start:start + self.width] = self.cells[r * self.width:(r + 1) * self.width]
+        return grid
+
+    def copy(self):
+        return Grid(self.width, self.height, self.cells[:])
+
+    def rows(self):
+        return [self.cells[r * self.width:(r + 1) * self.width] for r in range(self.height)]
+
+    def numpy(self):
+        """A (height, width) NumPy array sharing this grid's memory."""
+        import numpy as np
+
+        dtype = np.uint8 if isinstance(self.cells, bytearray) else np.dtype(self.cells.typecode)
+        return np.frombuffer(self.cells, dtype=dtype).reshape(self.height, self.width)
+
+    def __str__(self):
+        return "\n".join(row.decode("latin-1") for row in self.rows())
@@ -0,0 +1,123 @@
+"""
+Report how long each day's solver takes to import from a cold interpreter, like ``-X importtime``.
+
+    python -m aoc.imports                  # every day, heavy libraries imported eagerly
+    python -m aoc.imports --lazy           # numpy/pandas deferred until first use (see aoc.lazy)
+    python -m aoc.imports --budget 20      # exit non-zero if any day takes longer than 20 ms
+
+Each day is imported in a fresh ``python -X importtime`` process. The interpreter's own startup
+imports are left out and the rest are aggregated per day: the time to import the solver module,
+how many modules that pulled in, and the top-level packages that cost the most.
+"""
+import argparse
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass
+
+from aoc.runner import ROOT, discover, report
+
+COLUMNS = ["year", "day", "mode", "status", "import_ms", "modules", "heaviest"]
+TABLE_WIDTHS = [6, 5, 7, 8, 11, 9, 0]
+
+MARKER = "-- aoc.imports: solver import starts --"
+
+# Runs in the child; everything imported before the marker is interpreter or harness startup
+CHILD = """
+import importlib.util, sys, time
+{setup}
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("solver", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+print(time.perf_counter() - start)
+"""
+LAZY_SETUP = "import aoc.lazy; aoc.lazy.install()"
+
+
+@dataclass
+class ImportResult:
+    year: int
+    day: int
+    mode: str
+    status: str
+    import_ms: float | None
+    modules: int | None
+    heaviest: str
+
+
+def parse_importtime(lines):
+    """Turn ``-X importtime`` lines into (level, module, self_us, cumulative_us) tuples."""
+    entries = []
+    for line in lines:
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line.split("|")
+        # The name is indented by two spaces per level of nesting after a single separator space
+        name = name[1:]
+        level = (len(name) - len(name.lstrip())) // 2
+        entries.append((level, name.strip(), int(self_us.split(":")[1]), int(cumulative_us)))
+    return entries
+
+
+def heaviest(entries, top=3):
+    """The top-level packages the solver imported directly, by cumulative time."""
+    totals = Counter()
+    for level, name, _, cumulative_us in entries:
+        if level == 0:
+            totals[name.split(".")[0]] += cumulative_us
+    return ", ".join(f"{name} {us / 1000:.1f}ms" for name, us in totals.most_common(top))
+
+
+def measure_import(task, lazy=False, top=3):
+    """Import one day's solver in a fresh ``-X importtime`` interpreter and summarise it."""
+    code = CHILD.format(setup=LAZY_SETUP if lazy else "", marker=MARKER)
+    mode = "lazy" if lazy else "eager"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code, str(task.module)],
+                          cwd=ROOT, capture_output=True, text=True)
+    stderr = proc.stderr.splitlines()
+    if proc.returncode != 0:
+        error = next((line for line in reversed(stderr) if line.strip()), f"exit {proc.returncode}")
+        return ImportResult(task.year, task.day, mode, "error", None, None, error[:80])
+
+    entries = parse_importtime(stderr[stderr.index(MARKER) + 1:])
+    import_ms = round(float(proc.stdout.split()[-1]) * 1000, 2)
+    return ImportResult(task.year, task.day, mode, "ok", import_ms, len(entries), heaviest(entries, top))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.imports", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, action="append", help="only this year (repeatable)")
+    parser.add_argument("--day", type=int, action="append", help="only this day (repeatable)")
+    parser.add_argument("--lazy", action="store_true", help="defer numpy/pandas until first use")
+    parser.add_argument("--top", type=int, default=3, help="packages to list per day (default 3)")
+    parser.add_argument("--format", choices=["table", "csv", "json"], default="table")
+    parser.add_argument("--budget", type=float, metavar="MS",
+                        help="exit non-zero if any day takes longer than this to import")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tasks = discover(args.year, args.day)
+    if not tasks:
+        sys.exit("No solvers found for the given --year/--day.")
+
+    # One interpreter at a time, so the days do not compete for the disk and CPU they are timed on
+    results = report((measure_import(task, args.lazy, args.top) for task in tasks), args.format,
+                     columns=COLUMNS, widths=TABLE_WIDTHS)
+    total = sum(r.import_ms or 0 for r in results)
+    print(f"{len(results)} days imported in {total:.1f}ms ({results[0].mode})", file=sys.stderr)
+
+    if args.budget is not None:
+        over = [r for r in results if r.status != "ok" or r.import_ms > args.budget]
+        for r in over:
+            print(f"over budget: {r.year} day {r.day} took {r.import_ms}ms to import", file=sys.stderr)
+        if over:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Defer heavy third-party imports until the code that needs them actually runs.
+
+``install()`` puts a placeholder module into ``sys.modules`` for each heavy library, so a
+solver's top-level ``import numpy as np`` costs nothing; the real import happens on the first
+attribute access such as ``np.array``. Days that never touch the library on a given code path
+never pay for it.
+
+``importlib.util.LazyLoader`` is not enough here: on Python 3.11 the ``import`` statement itself
+inspects ``module.__spec__`` and that access already triggers the load.
+"""
+import importlib
+import importlib.util
+import sys
+import types
+
+HEAVY_MODULES = ("numpy", "pandas")
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module that imports the real one on first attribute access."""
+
+    def __getattr__(self, attr):
+        # Only called for attributes the placeholder does not have, i.e. everything but the
+        # basics every module object carries (__name__, __spec__, ...)
+        module = self._load()
+        return getattr(module, attr)
+
+    def _load(self):
+        name = self.__name__
+        if sys.modules.get(name) is self:
+            del sys.modules[name]
+        module = importlib.import_module(name)
+        # Copy the namespace so later lookups through existing references skip __getattr__
+        self.__dict__.update(module.__dict__)
+        return module
+
+
+def install(names=HEAVY_MODULES):
+    """
+    Register a LazyModule for every name that is installed but not yet imported, and return the
+    names that were deferred. Missing libraries are left alone so their ImportError surfaces as usual.
+    """
+    deferred = []
+    for name in names:
+        if name in sys.modules or importlib.util.find_spec(name) is None:
+            continue
+        sys.modules[name] = LazyModule(name)
+        deferred.append(name)
+    return deferred
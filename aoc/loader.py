@@ -0,0 +1,175 @@
+"""
+Shared input loading: memory-map the puzzle input once and parse it at the byte level.
+
+``load(path)`` returns a read-only ``memoryview`` over an ``mmap`` of the file, so nothing is
+copied until a solver asks for it. The helpers below accept that view (or any other buffer,
+including the memoryview slices they hand out themselves, and plain ``str`` for convenience) and
+scan it with compiled byte regexes, returning memoryview slices or ints rather than one ``str``
+per line:
+
+    data = load("input.txt")
+    ints(data)                # every integer in the input, as an array('q')
+    ints_per_line(data)       # a tuple of the integers on each line
+    blocks(data)              # memoryview slices between blank lines
+    grid(data)                # a ByteGrid indexing the rows in place
+
+A solver whose ``parse`` works on bytes marks it with ``@takes_bytes`` and the runner hands it
+the mapped input directly instead of decoded text.
+"""
+import mmap
+import os
+import re
+from array import array
+
+_NEWLINE = re.compile(rb"\n")
+_BLANK_LINE = re.compile(rb"\n[ \t\r]*\n")
+_INT = re.compile(rb"-?\d+")
+_UINT = re.compile(rb"\d+")
+
+
+def load(path):
+    """Memory-map a file read-only and return a memoryview over its bytes."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # mmap refuses empty files
+            return memoryview(b"")
+        # The view keeps the map alive; it stays valid after the file is closed
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def takes_bytes(parse):
+    """Mark a ``parse`` function that accepts the buffer from ``load`` rather than decoded text."""
+    parse.takes_bytes = True
+    return parse
+
+
+def as_buffer(data):
+    """A bytes-like view of ``data``; ``str`` is encoded, buffers are used as they are."""
+    if isinstance(data, str):
+        return data.encode()
+    return data
+
+
+def line_spans(data):
+    """Yield the (start, end) offsets of every line, without the newline ("\n" or "\r\n")."""
+    data = as_buffer(data)
+    start = 0
+    for match in _NEWLINE.finditer(data):
+        end = match.start()
+        yield start, end - 1 if end > start and data[end - 1] == 0x0D else end
+        start = match.end()
+    if start < len(data):
+        end = len(data)
+        yield start, end - 1 if data[end - 1] == 0x0D else end
+
+
+def lines(data):
+    """Every line as a memoryview slice of ``data`` (empty lines included)."""
+    view = memoryview(as_buffer(data))
+    return [view[start:end] for start, end in line_spans(view)]
+
+
+def blocks(data):
+    """The blank-line separated blocks of ``data`` as memoryview slices, without surrounding newlines."""
+    view = memoryview(as_buffer(data))
+    spans = []
+    start = 0
+    for match in _BLANK_LINE.finditer(view):
+        spans.append((start, match.start()))
+        start = match.end()
+    spans.append((start, len(view)))
+
+    result = []
+    for start, end in spans:
+        # Trim stray newlines at either end, e.g. the one that ends the file
+        while start < end and view[start] == 0x0A:
+            start += 1
+        while end > start and view[end - 1] in (0x0A, 0x0D):
+            end -= 1
+        if start < end:
+            result.append(view[start:end])
+    return result
+
+
+def ints(data, typecode="q", signed=True):
+    """
+    Every (optionally negative) integer in ``data``, in order, as an ``array``. With
+    ``signed=False`` a ``-`` is never part of a number, e.g. for ranges such as ``2-4``.
+    """
+    pattern = _INT if signed else _UINT
+    return array(typecode, map(int, pattern.findall(as_buffer(data))))
+
+
+def ints_per_line(data):
+    """A tuple of the integers on each non-empty line of ``data``."""
+    data = as_buffer(data)
+    return [
+        tuple(map(int, _INT.findall(data, start, end)))
+        for start, end in line_spans(data)
+        if end > start
+    ]
+
+
+class ByteGrid:
+    """
+    A rectangular grid of bytes indexed in place: cell (row, col) is ``data[row * stride + col]``
+    where ``stride`` is the width plus the line ending ("\n" or "\r\n").
+    """
+
+    __slots__ = ("data", "width", "height", "stride")
+
+    def __init__(self, data, width, height, stride):
+        self.data = data
+        self.width = width
+        self.height = height
+        self.stride = stride
+
+    def at(self, row, col):
+        """The byte value (an int) at (row, col)."""
+        return self.data[row * self.stride + col]
+
+    def row(self, row):
+        """One row as a memoryview slice."""
+        start = row * self.stride
+        return self.data[start:start + self.width]
+
+    def rows(self):
+        return [self.row(r) for r in range(self.height)]
+
+    def positions(self, value):
+        """Yield the (row, col) of every cell equal to ``value`` (a single byte, e.g. ``b"#"``)."""
+        for match in re.finditer(re.escape(value), self.data):
+            row, col = divmod(match.start(), self.stride)
+            if col < self.width:
+                yield row, col
+
+    def find(self, value):
+        """The (row, col) of the first cell equal to ``value``, or None."""
+        return next(self.positions(value), None)
+
+
+def grid(data):
+    """
+    View ``data`` as a ByteGrid without copying it. Every line must have the same width;
+    surrounding blank lines are ignored.
+    """
+    view = memoryview(as_buffer(data))
+    # Drop leading and trailing line endings so that the rows start at offset 0
+    start, end = 0, len(view)
+    while start < end and view[start] in (0x0A, 0x0D):
+        start += 1
+    while end > start and view[end - 1] in (0x0A, 0x0D):
+        end -= 1
+    view = view[start:end]
+
+    spans = list(line_spans(view))
+    if not spans:
+        return ByteGrid(view, 0, 0, 1)
+    width = spans[0][1] - spans[0][0]
+    if any(end - start != width for start, end in spans):
+        raise ValueError("grid rows have different widths")
+    # Rows end in "\n" or "\r\n"; either way every row must start one stride after the last
+    stride = spans[1][0] if len(spans) > 1 else width + 1
+    if any(start != row * stride for row, (start, _) in enumerate(spans)):
+        raise ValueError("grid rows have mixed line endings")
+    return ByteGrid(view, width, len(spans), stride)
@@ -0,0 +1,377 @@
+"""
+Discover every ``YYYY/day-NN`` solver, run each part and report wall time, CPU time and peak RSS.
+
+Run from the repository root:
+
+    python -m aoc                          # every day
+    python -m aoc --year 2022 --day 16     # a single day
+    python -m aoc --format json            # one JSON object per line
+    python -m aoc --jobs                   # spread the days over every core
+    python -m aoc --no-cache               # recompute even if the answer is cached
+
+Every day is a ``main.py`` module exposing ``parse(text)``, ``part1(parsed)`` and
+``part2(parsed)``. Each day is imported in its own freshly spawned worker process, which reads
+the input once (memory-mapped, see ``aoc.loader``), parses it once and hands the parsed
+structure to both parts; ``parse``, ``1`` and ``2`` are timed and reported as separate rows,
+after an ``import`` row for loading the module. ``--lazy-imports`` defers numpy and pandas until a solver first touches them (see ``aoc.lazy``),
+moving their cost from ``import`` to whichever phase needs them; ``python -m aoc.imports``
+reports cold-start import times per day. With ``--split-parts`` every part gets its own
+worker instead (parsing in each), which isolates the parts' peak RSS and lets them run side by
+side. Results are always reported in day and part order.
+
+Successful results are cached on disk keyed by hashes of the solver source, the shared ``aoc``
+package and the input (see ``aoc.cache``); a cached row is reported with status ``cached`` and the timings of the run
+that produced it.
+"""
+import argparse
+import contextlib
+import csv
+import importlib.util
+import io
+import json
+import os
+import re
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aoc import lazy, loader
+from aoc.cache import AnswerCache
+
+ROOT = Path(__file__).resolve().parent.parent
+
+YEAR_DIR = re.compile(r"\d{4}$")
+DAY_DIR = re.compile(r"day-(\d+)$")
+INPUT_NAMES = ["input.txt", "input"]
+SOLVER_NAME = "main.py"
+PARTS = ("1", "2")
+
+COLUMNS = ["year", "day", "part", "status", "wall_s", "cpu_s", "peak_rss_mb", "answer"]
+TABLE_WIDTHS = [6, 5, 7, 10, 10, 10, 13, 0]
+
+
+@dataclass
+class Task:
+    year: int
+    day: int
+    module: Path
+    input: Path | None
+    parts: tuple = PARTS
+    # Only one of the workers sharing a day reports the import and parse rows
+    report_parse: bool = True
+    # Defer numpy/pandas until first use (see aoc.lazy)
+    lazy_imports: bool = False
+
+    @property
+    def rows(self):
+        """The parts this task reports a row for, in order."""
+        return (["import", "parse"] if self.report_parse else []) + list(self.parts)
+
+    @property
+    def label(self):
+        """
+        Which rows this task produces and how, e.g. ``import+parse+1+2``, or ``import+parse+1+2+lazy``
+        with lazy imports, whose timings differ; also names and keys its cache entries.
+        """
+        return "+".join(self.rows + (["lazy"] if self.lazy_imports else []))
+
+
+@dataclass
+class Result:
+    year: int
+    day: int
+    part: str
+    status: str
+    wall_s: float
+    cpu_s: float
+    peak_rss_mb: float
+    answer: str
+
+
+def discover(years=None, days=None, split_parts=False, lazy_imports=False):
+    """
+    Return a Task for every day directory with a solver module, optionally filtered by year and
+    day. With ``split_parts`` there is one Task per part instead, and only the first reports parse.
+    """
+    tasks = []
+    for year_dir in sorted(ROOT.iterdir()):
+        if not (year_dir.is_dir() and YEAR_DIR.match(year_dir.name)):
+            continue
+        year = int(year_dir.name)
+        if years and year not in years:
+            continue
+
+        for day_dir in sorted(year_dir.iterdir()):
+            match = DAY_DIR.match(day_dir.name)
+            if not (day_dir.is_dir() and match):
+                continue
+            day = int(match.group(1))
+            if days and day not in days:
+                continue
+
+            module = day_dir / SOLVER_NAME
+            if not module.exists():
+                continue
+            input_path = find_input(day_dir)
+            if split_parts:
+                for i, part in enumerate(PARTS):
+                    tasks.append(Task(year, day, module, input_path, (part,), i == 0, lazy_imports))
+            else:
+                tasks.append(Task(year, day, module, input_path, lazy_imports=lazy_imports))
+    return tasks
+
+
+def find_input(day_dir):
+    """The puzzle input of a day directory, if it has one."""
+    for name in INPUT_NAMES:
+        if (day_dir / name).exists():
+            return day_dir / name
+    return None
+
+
+def peak_rss_mb():
+    """Peak resident set size of the current process in MiB."""
+    # On Linux ru_maxrss survives fork+exec, so a spawned worker would report its parent's
+    # peak if that was higher. VmHWM is reset on exec, so prefer it where it exists.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux but in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return round(peak * scale / 2**20, 1)
+
+
+def reset_peak_rss():
+    """Reset the VmHWM high-water mark so the next reading covers only what runs from now on."""
+    # Writing 5 to clear_refs resets the peak RSS on Linux 4.0+; elsewhere peaks simply accumulate
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+def load_solver(task):
+    """Import a day's solver module under a unique name without running anything but its top level."""
+    name = f"aoc_{task.year}_day_{task.day:02d}"
+    spec = importlib.util.spec_from_file_location(name, task.module)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(task, part, func, *args):
+    """Call ``func`` with its stdout discarded and return (Result, return value)."""
+    reset_peak_rss()
+    status = "ok"
+    value = None
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            value = func(*args)
+    except SystemExit as e:
+        # A solver that calls sys.exit() stops there, without an answer
+        if e.code not in (None, 0):
+            status = f"exit {e.code}"
+    except Exception as e:
+        status = "error"
+        # On failure the answer column carries the exception instead
+        value = f"{type(e).__name__}: {e}"[:80]
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    # A successful import or parse has no answer to show
+    answer = "" if value is None or (part in ("import", "parse") and status == "ok") else str(value)
+    result = Result(task.year, task.day, part, status, round(wall, 4), round(cpu, 4), peak_rss_mb(), answer)
+    return result, value
+
+
+def run_task(task):
+    """
+    Import one day's solver, parse its input once and run the task's parts on the parsed value.
+
+    Intended to be called in a fresh worker. Returns a list of Results: one each for ``import``
+    and ``parse`` (unless another task reports them) and one per part the module defines. A
+    failed import or parse ends the task.
+    """
+    # Solvers import the shared aoc package and, possibly, modules next to them
+    for path in (str(ROOT), str(task.module.parent)):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    if task.input is None:
+        return [Result(task.year, task.day, "parse", "error", None, None, None, "no input file")]
+    data = loader.load(task.input)
+
+    if task.lazy_imports:
+        lazy.install()
+
+    results = []
+    imported_result, module = measure(task, "import", load_solver, task)
+    if task.report_parse or imported_result.status != "ok":
+        results.append(imported_result)
+    if imported_result.status != "ok":
+        return results
+
+    # Solvers that parse bytes get the mapped input as is; the others get it decoded, with
+    # "\r\n" line endings translated as text-mode open() would, outside the timing
+    text = data if getattr(module.parse, "takes_bytes", False) else str(data, "utf-8").replace("\r\n", "\n")
+    parsed_result, parsed = measure(task, "parse", module.parse, text)
+    if task.report_parse or parsed_result.status != "ok":
+        results.append(parsed_result)
+    if parsed_result.status != "ok":
+        return results
+
+    for part in task.parts:
+        solve = getattr(module, f"part{part}", None)
+        if solve is None:
+            # e.g. day 25 has no second part
+            continue
+        result, _ = measure(task, part, solve, parsed)
+        results.append(result)
+    return results
+
+
+def worker_died(task, error):
+    """Error rows for a task whose worker process was killed, e.g. by the out-of-memory killer."""
+    answer = f"worker died: {type(error).__name__}"
+    return [Result(task.year, task.day, part, "error", None, None, None, answer) for part in task.rows]
+
+
+def run_alone(task):
+    """Run one task in a pool of its own, to tell whether it was the one that killed a shared pool."""
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        try:
+            return pool.submit(run_task, task).result()
+        except BrokenProcessPool as e:
+            return worker_died(task, e)
+
+
+def run_tasks(tasks, jobs=1, cache=None):
+    """
+    Yield the Results of every task, in task order, each task measured in its own worker process.
+
+    With ``jobs`` above one, independent tasks run concurrently; a task's results are yielded as
+    soon as it and every task before it have finished, so the output order never changes.
+    Tasks with an up-to-date entry in ``cache`` are not run at all.
+
+    A worker that dies (killed for running out of memory, say) breaks the whole pool: its task is
+    reported as an error and the unfinished tasks carry on in a fresh pool.
+    """
+    pool = ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1)
+    try:
+        pending = []
+        for task in tasks:
+            hit = cache.get(task) if cache else None
+            if hit:
+                pending.append([Result(**{**row, "status": "cached"}) for row in hit])
+            else:
+                pending.append(pool.submit(run_task, task))
+
+        for i, (task, item) in enumerate(zip(tasks, pending)):
+            if isinstance(item, list):
+                yield from item
+                continue
+            try:
+                results = item.result()
+            except BrokenProcessPool as e:
+                # Every unfinished task failed along with the one that died; with several
+                # workers this one may only have been sharing the pool, so it gets a rerun alone
+                results = run_alone(task) if jobs > 1 else worker_died(task, e)
+                pool.shutdown(cancel_futures=True)
+                pool = ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1)
+                for j in range(i + 1, len(tasks)):
+                    later = pending[j]
+                    if not isinstance(later, list) and not (later.done() and later.exception() is None):
+                        pending[j] = pool.submit(run_task, tasks[j])
+            if cache and results and all(result.status == "ok" for result in results):
+                cache.put(task, [asdict(result) for result in results])
+            yield from results
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def format_row(values, widths=TABLE_WIDTHS):
+    # Multi-line answers (e.g. a rendered screen) are folded onto one line in the table
+    cells = ("" if value is None else " / ".join(str(value).splitlines()) for value in values)
+    return "".join(cell.ljust(width) for cell, width in zip(cells, widths)).rstrip()
+
+
+def report(results, fmt, out=sys.stdout, columns=COLUMNS, widths=TABLE_WIDTHS):
+    """
+    Write dataclass results as they arrive in one of the 'table', 'csv' or 'json' (JSON Lines)
+    formats, and return them as a list.
+    """
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=columns)
+        writer.writeheader()
+    elif fmt == "table":
+        print(format_row(columns, widths), file=out)
+
+    collected = []
+    for result in results:
+        row = asdict(result)
+        if fmt == "csv":
+            writer.writerow(row)
+        elif fmt == "json":
+            print(json.dumps(row), file=out)
+        else:
+            print(format_row(row.values(), widths), file=out)
+        out.flush()
+        collected.append(result)
+    return collected
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, action="append", help="only run this year (repeatable)")
+    parser.add_argument("--day", type=int, action="append", help="only run this day (repeatable)")
+    parser.add_argument("--format", choices=["table", "csv", "json"], default="table")
+    parser.add_argument("-j", "--jobs", type=int, nargs="?", const=os.cpu_count(), default=1,
+                        help="worker processes to run days in parallel (default 1, bare -j uses every core)")
+    parser.add_argument("--split-parts", action="store_true",
+                        help="run each part in its own worker (parsing in each) instead of one worker per day")
+    parser.add_argument("--lazy-imports", action="store_true",
+                        help="load numpy/pandas only when a solver first uses them, not at import")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the answer cache")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="invalidate cached answers for the selected days before running")
+    parser.add_argument("--budget", type=float, metavar="SECONDS",
+                        help="exit non-zero if any part takes longer than this wall time")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tasks = discover(args.year, args.day, args.split_parts, args.lazy_imports)
+    if not tasks:
+        sys.exit("No solvers found for the given --year/--day.")
+
+    cache = None if args.no_cache else AnswerCache()
+    if args.clear_cache:
+        AnswerCache().clear(tasks if args.year or args.day else None)
+
+    jobs = max(1, min(args.jobs, len(tasks)))
+    start = time.perf_counter()
+    results = report(run_tasks(tasks, jobs, cache), args.format)
+    elapsed = time.perf_counter() - start
+    # Summary goes to stderr so that csv/json output stays machine-readable
+    print(f"{len(results)} rows in {elapsed:.2f}s on {jobs} worker(s); "
+          f"sum of row wall times {sum(r.wall_s or 0 for r in results):.2f}s", file=sys.stderr)
+
+    if args.budget is not None:
+        over = [r for r in results if r.wall_s is not None and r.wall_s > args.budget]
+        for r in over:
+            print(f"over budget: {r.year} day {r.day} part {r.part} took {r.wall_s}s", file=sys.stderr)
+        if over:
+            sys.exit(1)
@@ -0,0 +1,165 @@
+"""
+Shortest-path searches over graphs whose nodes are the integers ``0 .. size - 1``.
+
+Callers number their states (a flat grid index, a valve's position in a list, ``phase * cells +
+position`` for a time-dependent map, ...) and supply a ``neighbours(node)`` function; distances
+live in a flat ``array`` with ``UNREACHED`` for nodes not (yet) reached, so there are no
+per-node dicts or tuples. Every search accepts one source or many, and an optional ``goal`` (a
+node, a collection of nodes or a predicate) at which it stops early.
+
+    search(size, sources, neighbours, goal=None, weights="unit")
+
+picks the cheapest algorithm for the edge weights: plain BFS when every edge costs 1 (and
+``neighbours`` yields node ids), 0-1 BFS for weights of 0 and 1, and Dijkstra, or A* given a
+heuristic, for any other non-negative weights (``neighbours`` then yields ``(node, weight)``
+pairs). The algorithms are also available directly as ``bfs``, ``bfs01``, ``dijkstra`` and
+``astar``.
+"""
+import heapq
+from array import array
+from collections import deque
+from dataclasses import dataclass
+
+UNREACHED = -1
+WEIGHTS = ("unit", "binary", "positive")
+
+
+@dataclass
+class Search:
+    """The distance to every node reached, and the goal node the search stopped at, if any."""
+
+    distances: array
+    goal: int | None = None
+
+    @property
+    def distance(self):
+        """The distance to the goal that was reached, or None."""
+        return None if self.goal is None else self.distances[self.goal]
+
+    def reached(self):
+        """The nodes with a known distance."""
+        return [node for node, distance in enumerate(self.distances) if distance != UNREACHED]
+
+
+def _goal_test(goal):
+    """A predicate for ``goal``: None, a single node, a collection of nodes or a predicate already."""
+    if goal is None or callable(goal):
+        return goal
+    if isinstance(goal, int):
+        return goal.__eq__
+    return frozenset(goal).__contains__
+
+
+def _start(size, sources, typecode):
+    """The distance array with every source at 0, and the sources as a list."""
+    sources = [sources] if isinstance(sources, int) else list(sources)
+    distances = array(typecode, [UNREACHED]) * size
+    for source in sources:
+        distances[source] = 0
+    return distances, sources
+
+
+def bfs(size, sources, neighbours, goal=None, typecode="l"):
+    """
+    Breadth-first search for graphs whose edges all cost 1; ``neighbours(node)`` yields node ids.
+    Runs level by level over plain lists, and stops as soon as a goal node is discovered.
+    """
+    is_goal = _goal_test(goal)
+    distances, frontier = _start(size, sources, typecode)
+    if is_goal:
+        for source in frontier:
+            if is_goal(source):
+                return Search(distances, source)
+
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for node in frontier:
+            for neighbour in neighbours(node):
+                if distances[neighbour] == UNREACHED:
+                    distances[neighbour] = depth
+                    if is_goal and is_goal(neighbour):
+                        return Search(distances, neighbour)
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    return Search(distances)
+
+
+def bfs01(size, sources, neighbours, goal=None, typecode="l"):
+    """
+    0-1 BFS for edges costing 0 or 1; ``neighbours(node)`` yields ``(node, weight)`` pairs.
+    Free edges go to the front of the deque, so nodes still leave it in distance order.
+    """
+    is_goal = _goal_test(goal)
+    distances, sources = _start(size, sources, typecode)
+    queue = deque(sources)
+    while queue:
+        node = queue.popleft()
+        if is_goal and is_goal(node):
+            return Search(distances, node)
+        distance = distances[node]
+        for neighbour, weight in neighbours(node):
+            new_distance = distance + weight
+            current = distances[neighbour]
+            if current == UNREACHED or new_distance < current:
+                distances[neighbour] = new_distance
+                if weight:
+                    queue.append(neighbour)
+                else:
+                    queue.appendleft(neighbour)
+    return Search(distances)
+
+
+def dijkstra(size, sources, neighbours, goal=None, typecode="q"):
+    """Dijkstra's algorithm for non-negative weights; ``neighbours(node)`` yields ``(node, weight)`` pairs."""
+    return astar(size, sources, neighbours, goal, None, typecode)
+
+
+def astar(size, sources, neighbours, goal, heuristic, typecode="q"):
+    """
+    A* search: Dijkstra ordered by distance plus ``heuristic(node)``, which must never overestimate
+    the remaining distance to a goal. Without a heuristic this is Dijkstra.
+    """
+    is_goal = _goal_test(goal)
+    distances, sources = _start(size, sources, typecode)
+    queue = [(heuristic(source) if heuristic else 0, 0, source) for source in sources]
+    heapq.heapify(queue)
+    while queue:
+        _, distance, node = heapq.heappop(queue)
+        if distance > distances[node]:
+            # A shorter route to this node was found after this entry was queued
+            continue
+        if is_goal and is_goal(node):
+            return Search(distances, node)
+        for neighbour, weight in neighbours(node):
+            new_distance = distance + weight
+            current = distances[neighbour]
+            if current == UNREACHED or new_distance < current:
+                distances[neighbour] = new_distance
+                priority = new_distance + heuristic(neighbour) if heuristic else new_distance
+                heapq.heappush(queue, (priority, new_distance, neighbour))
+    return Search(distances)
+
+
+def search(size, sources, neighbours, goal=None, weights="unit", heuristic=None):
+    """
+    Shortest distances from ``sources`` using the cheapest algorithm for ``weights``: 'unit' (BFS,
+    ``neighbours`` yields nodes), 'binary' (0-1 BFS) or 'positive' (Dijkstra, or A* with a
+    ``heuristic``); the last two take ``(node, weight)`` pairs. A heuristic turns any of them into
+    A*, with unit neighbours given a weight of 1 each.
+    """
+    if weights not in WEIGHTS:
+        raise ValueError(f"weights must be one of {', '.join(WEIGHTS)}, not {weights!r}")
+    if heuristic is not None:
+        if weights == "unit":
+            unit_neighbours = neighbours
+
+            def neighbours(node):
+                return ((neighbour, 1) for neighbour in unit_neighbours(node))
+        return astar(size, sources, neighbours, goal, heuristic)
+    if weights == "unit":
+        return bfs(size, sources, neighbours, goal)
+    if weights == "binary":
+        return bfs01(size, sources, neighbours, goal)
+    return dijkstra(size, sources, neighbours, goal)